@@ -13,7 +13,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from version import __version__, DEB_VERSION, DEB_MAINTAINER, DEB_HOMEPAGE, CHANGELOG
+from version import __version__, DEB_VERSION, DEB_MAINTAINER, DEB_HOMEPAGE, get_changelog
 
 def create_deb_package():
     """Create a .deb package for Ubuntu/Debian systems."""
@@ -165,9 +165,9 @@ License: MIT
     with open(deb_dir / "usr" / "share" / "doc" / "comic-strip-browser" / "copyright", "w") as f:
         f.write(copyright_content)
     
-    # Create changelog file (from version.py)
+    # Create changelog file (from CHANGELOG)
     with open(deb_dir / "usr" / "share" / "doc" / "comic-strip-browser" / "changelog", "w") as f:
-        f.write(CHANGELOG)
+        f.write(get_changelog())
     subprocess.run(["gzip", "-9", str(deb_dir / "usr" / "share" / "doc" / "comic-strip-browser" / "changelog")])
     
     # Build the .deb package
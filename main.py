@@ -12,7 +12,9 @@ import signal
 import os
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtGui import QPixmapCache
 from ui.main_window import MainWindow
+from ui.comic_viewer import PIXMAP_CACHE_LIMIT_KB
 from services.config_manager import ConfigManager
 from services.cache_manager import CacheManager
 from services.comic_service import ComicService
@@ -75,6 +77,9 @@ class ComicStripBrowser:
         self.app.setApplicationVersion(__version__)
         self.app.setOrganizationName("Comic Browser")
 
+        # Process-wide cache of decoded comics (see ComicViewer)
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
+
         # Connect application aboutToQuit signal for cleanup
         self.app.aboutToQuit.connect(self.shutdown)
     
@@ -84,8 +89,10 @@ class ComicStripBrowser:
             # Initialize services in dependency order
             self.error_handler = ErrorHandler()
             self.config_manager = ConfigManager()
-            self.cache_manager = CacheManager(error_handler=self.error_handler)
             self.web_scraper = WebScraper(error_handler=self.error_handler)
+            self.cache_manager = CacheManager(
+                error_handler=self.error_handler, session=self.web_scraper.session
+            )
             self.date_manager = DateManager(
                 web_scraper=self.web_scraper,
                 config_manager=self.config_manager
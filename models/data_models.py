@@ -6,6 +6,7 @@ and cache entries used throughout the application.
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime, date
 from typing import Optional, List, Tuple
 
@@ -55,6 +56,11 @@ class ComicData:
         if not self.author or not isinstance(self.author, str):
             raise ValueError("author must be a non-empty string")
 
+    @cached_property
+    def display_date(self) -> str:
+        """Long date for headers, e.g. "January 05, 2024", computed once per instance."""
+        return self.date.strftime("%B %d, %Y")
+
 
 @dataclass
 class ComicDefinition:
@@ -82,6 +88,21 @@ class ComicDefinition:
     skip_days: Optional[tuple] = None
     never_scale_up: bool = False
     
+    @cached_property
+    def publish_weekdays(self) -> Optional[frozenset]:
+        """
+        Weekdays (Monday is 0) the comic is published on, when it follows a
+        single weekly pattern; None when its schedule changes over time.
+        """
+        if any([self.weekly_between, self.daily_between, self.daily_since,
+                self.daily_since_no_sundays, self.weekly_since, self.dates_one_off]):
+            return None
+        if self.normal_is_sundays == "true":
+            return frozenset({6})
+        if self.never_on_sundays == "true":
+            return frozenset(range(6))
+        return None
+    
     def is_available(self, check_date: date) -> bool:
         """
         Check if the comic is available for a specific date based on complex rules.
@@ -795,6 +816,10 @@ COMIC_DEFINITIONS = [
 ]
 
 
+# Name -> definition index, so lookups don't scan COMIC_DEFINITIONS
+_COMIC_DEFINITIONS_BY_NAME = {comic_def.name: comic_def for comic_def in COMIC_DEFINITIONS}
+
+
 def get_comic_definition(name: str) -> Optional[ComicDefinition]:
     """
     Get a comic definition by name.
@@ -805,10 +830,7 @@ def get_comic_definition(name: str) -> Optional[ComicDefinition]:
     Returns:
         ComicDefinition if found, None otherwise
     """
-    for comic_def in COMIC_DEFINITIONS:
-        if comic_def.name == name:
-            return comic_def
-    return None
+    return _COMIC_DEFINITIONS_BY_NAME.get(name)
 
 
 def get_all_comic_names() -> list[str]:
@@ -10,6 +10,7 @@ metadata and image file storage.
 import os
 import json
 import shutil
+import threading
 from datetime import datetime, date
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -32,18 +33,24 @@ class CacheManager:
     used entries are removed.
     """
     
-    def __init__(self, cache_dir: str = "cache", error_handler: Optional[ErrorHandler] = None):
+    def __init__(self, cache_dir: str = "cache", error_handler: Optional[ErrorHandler] = None,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the cache manager.
         
         Args:
             cache_dir: Base directory for cache storage
             error_handler: ErrorHandler instance for error management
+            session: HTTP session to download images with (a plain one if omitted)
         """
         self.cache_dir = Path(cache_dir)
         self.max_entries_per_comic = 50
         self.error_handler = error_handler or ErrorHandler()
+        self.session = session or requests.Session()
         self._cache_index: Dict[str, Dict[str, CacheEntry]] = {}
+        # Guards _cache_index and the index files: comics are loaded and
+        # probed from worker threads as well as the GUI thread
+        self._lock = threading.RLock()
         
         # Create cache directory structure
         try:
@@ -123,7 +130,7 @@ class CacheManager:
             True if download successful, False otherwise
         """
         try:
-            response = requests.get(image_url, timeout=30, stream=True)
+            response = self.session.get(image_url, timeout=30, stream=True)
             response.raise_for_status()
             
             with open(target_path, 'wb') as f:
@@ -186,26 +193,28 @@ class CacheManager:
         comic_dir = self._get_comic_cache_dir(comic_name)
         index_file = comic_dir / "cache_index.json"
 
-        if comic_name not in self._cache_index:
-            return
+        with self._lock:
+            if comic_name not in self._cache_index:
+                return
 
-        try:
-            index_data = {}
-            for date_key, cache_entry in self._cache_index[comic_name].items():
-                index_data[date_key] = self._serialize_cache_entry(cache_entry)
+            try:
+                index_data = {}
+                for date_key, cache_entry in self._cache_index[comic_name].items():
+                    index_data[date_key] = self._serialize_cache_entry(cache_entry)
 
-            with open(index_file, 'w') as f:
-                json.dump(index_data, f, indent=2)
-        except (IOError, json.JSONEncodeError) as e:
-            print(f"Failed to save cache index for {comic_name}: {e}")
+                with open(index_file, 'w') as f:
+                    json.dump(index_data, f, indent=2)
+            except (IOError, json.JSONEncodeError) as e:
+                print(f"Failed to save cache index for {comic_name}: {e}")
 
     def invalidate_comic_date(self, comic_name: str, comic_date: date) -> None:
         """Remove a cached entry for a specific comic and date."""
         date_key = self._get_date_key(comic_date)
 
         # Remove from in-memory index
-        if comic_name in self._cache_index:
-            self._cache_index[comic_name].pop(date_key, None)
+        with self._lock:
+            if comic_name in self._cache_index:
+                self._cache_index[comic_name].pop(date_key, None)
 
         # Remove cached image file
         image_path = self.cache_dir / comic_name / f"{date_key}.jpg"
@@ -225,38 +234,39 @@ class CacheManager:
     
     def _cleanup_old_entries(self, comic_name: str) -> None:
         """Remove oldest cache entries when limit is exceeded."""
-        if comic_name not in self._cache_index:
-            return
+        with self._lock:
+            if comic_name not in self._cache_index:
+                return
         
-        cache_entries = self._cache_index[comic_name]
-        if len(cache_entries) <= self.max_entries_per_comic:
-            return
+            cache_entries = self._cache_index[comic_name]
+            if len(cache_entries) <= self.max_entries_per_comic:
+                return
         
-        # Sort by last_accessed time (oldest first)
-        sorted_entries = sorted(
-            cache_entries.items(),
-            key=lambda x: x[1].last_accessed
-        )
+            # Sort by last_accessed time (oldest first)
+            sorted_entries = sorted(
+                cache_entries.items(),
+                key=lambda x: x[1].last_accessed
+            )
         
-        # Remove oldest entries
-        entries_to_remove = len(cache_entries) - self.max_entries_per_comic
-        for i in range(entries_to_remove):
-            date_key, cache_entry = sorted_entries[i]
+            # Remove oldest entries
+            entries_to_remove = len(cache_entries) - self.max_entries_per_comic
+            for i in range(entries_to_remove):
+                date_key, cache_entry = sorted_entries[i]
             
-            # Remove image file if it exists
-            if cache_entry.comic_data.cached_image_path:
-                image_path = Path(cache_entry.comic_data.cached_image_path)
-                if image_path.exists():
-                    try:
-                        image_path.unlink()
-                    except OSError as e:
-                        print(f"Failed to remove cached image {image_path}: {e}")
+                # Remove image file if it exists
+                if cache_entry.comic_data.cached_image_path:
+                    image_path = Path(cache_entry.comic_data.cached_image_path)
+                    if image_path.exists():
+                        try:
+                            image_path.unlink()
+                        except OSError as e:
+                            print(f"Failed to remove cached image {image_path}: {e}")
             
-            # Remove from cache index
-            del self._cache_index[comic_name][date_key]
+                # Remove from cache index
+                del self._cache_index[comic_name][date_key]
         
-        # Save updated index
-        self._save_cache_index(comic_name)
+            # Save updated index
+            self._save_cache_index(comic_name)
     
     def cache_comic(self, comic_data: ComicData) -> bool:
         """
@@ -265,13 +275,9 @@ class CacheManager:
         comic_name = comic_data.comic_name
         date_key = self._get_date_key(comic_data.date)
         
-        # Initialize comic cache if needed
-        if comic_name not in self._cache_index:
-            self._cache_index[comic_name] = {}
-        
         try:
             # Step 1: Download the image into memory (ONLY ONE DOWNLOAD)
-            response = requests.get(comic_data.image_url, timeout=30)
+            response = self.session.get(comic_data.image_url, timeout=30)
             response.raise_for_status()
             image_bytes = response.content
             
@@ -308,14 +314,15 @@ class CacheManager:
                 file_size=file_size
             )
             
-            # Store in cache index
-            self._cache_index[comic_name][date_key] = cache_entry
-            
-            # Clean up old entries if needed
-            self._cleanup_old_entries(comic_name)
-            
-            # Save cache index
-            self._save_cache_index(comic_name)
+            with self._lock:
+                # Store in cache index
+                self._cache_index.setdefault(comic_name, {})[date_key] = cache_entry
+                
+                # Clean up old entries if needed
+                self._cleanup_old_entries(comic_name)
+                
+                # Save cache index
+                self._save_cache_index(comic_name)
             
             return True
             
@@ -335,30 +342,89 @@ class CacheManager:
         Returns:
             ComicData if found in cache, None otherwise
         """
-        if comic_name not in self._cache_index:
-            return None
-        
         date_key = self._get_date_key(comic_date)
-        if date_key not in self._cache_index[comic_name]:
-            return None
-        
-        cache_entry = self._cache_index[comic_name][date_key]
+        with self._lock:
+            if comic_name not in self._cache_index:
+                return None
         
-        # Verify cached image still exists
-        if cache_entry.comic_data.cached_image_path:
-            image_path = Path(cache_entry.comic_data.cached_image_path)
-            if not image_path.exists():
-                # Image file is missing, remove from cache
-                del self._cache_index[comic_name][date_key]
-                self._save_cache_index(comic_name)
+            if date_key not in self._cache_index[comic_name]:
                 return None
         
-        # Update access information
-        cache_entry.access_count += 1
-        cache_entry.last_accessed = datetime.now()
-        self._save_cache_index(comic_name)
+            cache_entry = self._cache_index[comic_name][date_key]
+        
+            # Verify cached image still exists
+            if cache_entry.comic_data.cached_image_path:
+                image_path = Path(cache_entry.comic_data.cached_image_path)
+                if not image_path.exists():
+                    # Image file is missing, remove from cache
+                    del self._cache_index[comic_name][date_key]
+                    self._save_cache_index(comic_name)
+                    return None
+        
+            # Update access information
+            cache_entry.access_count += 1
+            cache_entry.last_accessed = datetime.now()
+            self._save_cache_index(comic_name)
         
-        return cache_entry.comic_data
+            return cache_entry.comic_data
+    
+    def get_cached_comics_batch(self, comic_name: str, comic_dates: List[date]) -> Dict[date, ComicData]:
+        """
+        Retrieve several cached comics of one comic strip at once.
+        
+        The comic's cache directory is listed once instead of checking each
+        image file separately, and the cache index is saved once.
+        
+        Args:
+            comic_name: Name of the comic strip
+            comic_dates: Dates of the comics
+            
+        Returns:
+            Dict mapping each cached date to its ComicData (dates not cached are left out)
+        """
+        with self._lock:
+            entries = self._cache_index.get(comic_name)
+            if not entries:
+                return {}
+            
+            wanted = {}
+            for comic_date in comic_dates:
+                date_key = self._get_date_key(comic_date)
+                if date_key in entries:
+                    wanted[comic_date] = date_key
+            if not wanted:
+                return {}
+            
+            # One directory listing instead of one stat per image
+            comic_dir = str(self.cache_dir / comic_name)
+            try:
+                present = {entry.name for entry in os.scandir(comic_dir)}
+            except OSError:
+                present = set()
+            
+            cached = {}
+            now = datetime.now()
+            for comic_date, date_key in wanted.items():
+                cache_entry = entries[date_key]
+                image_path = cache_entry.comic_data.cached_image_path
+                if image_path:
+                    directory, filename = os.path.split(image_path)
+                    if directory == comic_dir:
+                        exists = filename in present
+                    else:
+                        exists = os.path.exists(image_path)
+                    if not exists:
+                        # Image file is missing, remove from cache
+                        del entries[date_key]
+                        continue
+                
+                # Update access information
+                cache_entry.access_count += 1
+                cache_entry.last_accessed = now
+                cached[comic_date] = cache_entry.comic_data
+            
+            self._save_cache_index(comic_name)
+            return cached
     
     def is_cached(self, comic_name: str, comic_date: date) -> bool:
         """
@@ -383,22 +449,23 @@ class CacheManager:
         Returns:
             Dictionary with cache statistics
         """
-        if comic_name not in self._cache_index:
-            return {
-                'total_entries': 0,
-                'total_size': 0,
-                'total_accesses': 0
-            }
+        with self._lock:
+            if comic_name not in self._cache_index:
+                return {
+                    'total_entries': 0,
+                    'total_size': 0,
+                    'total_accesses': 0
+                }
         
-        cache_entries = self._cache_index[comic_name]
-        total_size = sum(entry.file_size for entry in cache_entries.values())
-        total_accesses = sum(entry.access_count for entry in cache_entries.values())
+            cache_entries = self._cache_index[comic_name]
+            total_size = sum(entry.file_size for entry in cache_entries.values())
+            total_accesses = sum(entry.access_count for entry in cache_entries.values())
         
-        return {
-            'total_entries': len(cache_entries),
-            'total_size': total_size,
-            'total_accesses': total_accesses
-        }
+            return {
+                'total_entries': len(cache_entries),
+                'total_size': total_size,
+                'total_accesses': total_accesses
+            }
     
     def get_all_cache_stats(self) -> Dict[str, Dict[str, int]]:
         """
@@ -407,10 +474,11 @@ class CacheManager:
         Returns:
             Dictionary mapping comic names to their cache statistics
         """
-        stats = {}
-        for comic_name in self._cache_index.keys():
-            stats[comic_name] = self.get_cache_stats(comic_name)
-        return stats
+        with self._lock:
+            stats = {}
+            for comic_name in self._cache_index.keys():
+                stats[comic_name] = self.get_cache_stats(comic_name)
+            return stats
     
     def clear_cache(self, comic_name: Optional[str] = None) -> None:
         """
@@ -419,41 +487,42 @@ class CacheManager:
         Args:
             comic_name: Name of comic to clear, or None to clear all
         """
-        if comic_name:
-            # Clear specific comic cache
-            if comic_name in self._cache_index:
-                comic_dir = self._get_comic_cache_dir(comic_name)
+        with self._lock:
+            if comic_name:
+                # Clear specific comic cache
+                if comic_name in self._cache_index:
+                    comic_dir = self._get_comic_cache_dir(comic_name)
                 
-                # Remove all cached files
-                for cache_entry in self._cache_index[comic_name].values():
-                    if cache_entry.comic_data.cached_image_path:
-                        image_path = Path(cache_entry.comic_data.cached_image_path)
-                        if image_path.exists():
-                            try:
-                                image_path.unlink()
-                            except OSError as e:
-                                print(f"Failed to remove {image_path}: {e}")
+                    # Remove all cached files
+                    for cache_entry in self._cache_index[comic_name].values():
+                        if cache_entry.comic_data.cached_image_path:
+                            image_path = Path(cache_entry.comic_data.cached_image_path)
+                            if image_path.exists():
+                                try:
+                                    image_path.unlink()
+                                except OSError as e:
+                                    print(f"Failed to remove {image_path}: {e}")
                 
-                # Remove cache index file
-                index_file = comic_dir / "cache_index.json"
-                if index_file.exists():
-                    try:
-                        index_file.unlink()
-                    except OSError as e:
-                        print(f"Failed to remove cache index {index_file}: {e}")
+                    # Remove cache index file
+                    index_file = comic_dir / "cache_index.json"
+                    if index_file.exists():
+                        try:
+                            index_file.unlink()
+                        except OSError as e:
+                            print(f"Failed to remove cache index {index_file}: {e}")
                 
-                # Remove from memory
-                del self._cache_index[comic_name]
+                    # Remove from memory
+                    del self._cache_index[comic_name]
                 
-                # Remove directory if empty
-                try:
-                    comic_dir.rmdir()
-                except OSError:
-                    pass  # Directory not empty or other error
-        else:
-            # Clear all caches
-            for comic_name in list(self._cache_index.keys()):
-                self.clear_cache(comic_name)
+                    # Remove directory if empty
+                    try:
+                        comic_dir.rmdir()
+                    except OSError:
+                        pass  # Directory not empty or other error
+            else:
+                # Clear all caches
+                for comic_name in list(self._cache_index.keys()):
+                    self.clear_cache(comic_name)
     
     def get_cached_dates(self, comic_name: str) -> List[date]:
         """
@@ -465,15 +534,16 @@ class CacheManager:
         Returns:
             List of dates that are cached for this comic
         """
-        if comic_name not in self._cache_index:
-            return []
+        with self._lock:
+            if comic_name not in self._cache_index:
+                return []
         
-        dates = []
-        for date_key in self._cache_index[comic_name].keys():
-            try:
-                comic_date = date.fromisoformat(date_key)
-                dates.append(comic_date)
-            except ValueError:
-                continue
+            dates = []
+            for date_key in self._cache_index[comic_name].keys():
+                try:
+                    comic_date = date.fromisoformat(date_key)
+                    dates.append(comic_date)
+                except ValueError:
+                    continue
         
-        return sorted(dates)
\ No newline at end of file
+            return sorted(dates)
\ No newline at end of file
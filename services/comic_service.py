@@ -7,9 +7,13 @@ for comic retrieval with caching, fallback logic, and availability validation.
 """
 
 # import logging
+import threading
+import time
 from datetime import date, timedelta
 from typing import Optional, Dict, List
 
+from requests.exceptions import ConnectionError as RequestsConnectionError, HTTPError, Timeout
+
 from models.data_models import ComicData, get_comic_definition, COMIC_DEFINITIONS
 from services.web_scraper import WebScraper, WebScrapingError
 from services.cache_manager import CacheManager
@@ -23,6 +27,31 @@ class ComicServiceError(Exception):
     pass
 
 
+class ComicNotAvailableError(ComicServiceError):
+    """Exception raised when no comic is published for the requested date."""
+    
+    def __init__(self, comic_name: str, comic_date: date):
+        super().__init__(f"Comic {comic_name} not available for {comic_date}")
+        self.comic_name = comic_name
+        self.comic_date = comic_date
+
+
+def _is_network_failure(error: Exception) -> bool:
+    """
+    Check whether an error (or one it was raised from) means the site could
+    not be reached or is refusing requests, as opposed to a missing comic.
+    """
+    while error is not None:
+        if isinstance(error, (RequestsConnectionError, Timeout)):
+            return True
+        if isinstance(error, HTTPError) and error.response is not None:
+            status = error.response.status_code
+            if status == 429 or status >= 500:
+                return True
+        error = error.__cause__
+    return False
+
+
 class ComicService:
     """
     Core service for comic retrieval and management.
@@ -50,14 +79,47 @@ class ComicService:
         """
         self.error_handler = error_handler or ErrorHandler()
         self.web_scraper = web_scraper or WebScraper(error_handler=self.error_handler)
-        self.cache_manager = cache_manager or CacheManager(error_handler=self.error_handler)
+        # Pages and images share one pool of kept-alive connections
+        self.cache_manager = cache_manager or CacheManager(
+            error_handler=self.error_handler, session=self.web_scraper.session
+        )
         self.config_manager = config_manager or ConfigManager()
         self.date_manager = date_manager or DateManager(
             web_scraper=self.web_scraper,
             config_manager=self.config_manager
         )
+        # Recent network failures, for is_degraded; updated from worker threads
+        self._net_lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._last_net_failure_ts = float("-inf")
         # self.logger = logging.getLogger(__name__)
     
+    def is_degraded(self, threshold: int = 3, cooldown: float = 30) -> bool:
+        """
+        Check whether the site looks unreachable or rate-limited, so that
+        speculative fetches can stick to the cache for a while.
+        
+        Args:
+            threshold: Consecutive network failures that mark the service degraded
+            cooldown: Seconds after the last failure before requests are tried again
+            
+        Returns:
+            True if there were at least threshold failures in a row, the last
+            one less than cooldown seconds ago
+        """
+        with self._net_lock:
+            return (self._consecutive_failures >= threshold
+                    and time.monotonic() - self._last_net_failure_ts < cooldown)
+    
+    def _record_network_result(self, failed: bool) -> None:
+        """Count a network failure, or reset the count after a success."""
+        with self._net_lock:
+            if failed:
+                self._consecutive_failures += 1
+                self._last_net_failure_ts = time.monotonic()
+            else:
+                self._consecutive_failures = 0
+    
     def get_comic(self, comic_name: str, comic_date: Optional[date] = None) -> ComicData:
         """
         Retrieve a comic for a specific date with fallback logic.
@@ -102,6 +164,7 @@ class ComicService:
         # Not in cache, try to fetch from web
         try:
             comic_data = self._fetch_comic_from_web(comic_name, comic_date)
+            self._record_network_result(failed=False)
             
             # Cache the successful result
             try:
@@ -128,7 +191,7 @@ class ComicService:
                     pass  # Fall through to main error
             
             # Re-raise the ComicUnavailableError
-            raise ComicServiceError(f"Comic {comic_name} not available for {comic_date}")
+            raise ComicNotAvailableError(comic_name, comic_date)
             
         except (NetworkError, ParsingError) as e:
             # Try to get from cache as fallback for network/parsing errors
@@ -150,6 +213,8 @@ class ComicService:
             raise ComicServiceError(f"Could not retrieve {comic_name} for {comic_date}: {e}")
             
         except WebScrapingError as e:
+            if _is_network_failure(e):
+                self._record_network_result(failed=True)
             error_str = str(e).lower()
 
             # If the server returned content for a wrong date, invalidate the cache for that date
@@ -389,6 +454,12 @@ class ComicService:
         """Clear error statistics and recent errors."""
         self.error_handler.clear_error_statistics()
     
+    def close(self) -> None:
+        """Close the HTTP sessions and the connections they keep alive."""
+        self.web_scraper.session.close()
+        if self.cache_manager.session is not self.web_scraper.session:
+            self.cache_manager.session.close()
+    
     def get_user_friendly_error_message(self, error: Exception) -> str:
         """
         Get a user-friendly error message for an exception.
@@ -399,6 +470,10 @@ class ComicService:
         Returns:
             User-friendly error message
         """
+        if isinstance(error, ComicNotAvailableError):
+            comic_error = ComicUnavailableError(str(error), error.comic_name, error.comic_date)
+            return self.error_handler.get_user_friendly_message(comic_error)
+        
         # Convert ComicServiceError to appropriate error type for user message
         if isinstance(error, ComicServiceError):
             error_msg = str(error).lower()
@@ -424,7 +499,6 @@ class ComicService:
                         pass
 
                 # Create a ComicUnavailableError with correct info
-                from services.error_handler import ComicUnavailableError
                 comic_error = ComicUnavailableError(str(error), comic_name, error_date)
                 return self.error_handler.get_user_friendly_message(comic_error)
             elif "no og:image" in error_msg or "no image" in error_msg:
@@ -445,7 +519,6 @@ class ComicService:
                     except ValueError:
                         pass
 
-                from services.error_handler import ComicUnavailableError
                 comic_error = ComicUnavailableError(str(error), comic_name, error_date)
                 return self.error_handler.get_user_friendly_message(comic_error)
             elif "security challenge" in error_msg or "ip may be blocked" in error_msg:
@@ -477,11 +550,14 @@ class ComicService:
         Returns:
             List of recovery suggestions
         """
+        if isinstance(error, ComicNotAvailableError):
+            comic_error = ComicUnavailableError(str(error), error.comic_name, error.comic_date)
+            return self.error_handler.get_recovery_suggestions(comic_error)
+        
         # Convert ComicServiceError to appropriate error type for suggestions
         if isinstance(error, ComicServiceError):
             error_msg = str(error).lower()
             if "not available" in error_msg:
-                from services.error_handler import ComicUnavailableError
                 comic_error = ComicUnavailableError(str(error), "unknown", date.today())
                 return self.error_handler.get_recovery_suggestions(comic_error)
             elif "network" in error_msg or "connection" in error_msg:
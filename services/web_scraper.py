@@ -10,11 +10,45 @@ from bs4 import BeautifulSoup
 from models.data_models import ComicData
 import datetime
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, RequestException
 
 from services.error_handler import ErrorHandler, NetworkError, ParsingError
 
 
+# Headers sent with every page request
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Cache-Control': 'no-cache, no-store, must-revalidate',
+    'Pragma': 'no-cache',
+    'Expires': '0'
+}
+
+# Connection pools kept per session (one per host) and connections per pool;
+# enough for a search window, the prefetches and a load running at once
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+
+def create_session() -> requests.Session:
+    """
+    Create an HTTP session whose connections are kept alive and reused.
+    
+    Returns:
+        Session with the request headers set and pooled HTTP(S) adapters
+    """
+    session = requests.Session()
+    session.headers.update(REQUEST_HEADERS)
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 class WebScrapingError(Exception):
     """Exception raised when web scraping fails."""
     pass
@@ -26,16 +60,19 @@ class WebScraper:
     Uses requests for page retrieval and BeautifulSoup for HTML parsing.
     """
     
-    def __init__(self, timeout: int = 5, error_handler: Optional[ErrorHandler] = None):
+    def __init__(self, timeout: int = 5, error_handler: Optional[ErrorHandler] = None,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the WebScraper.
         
         Args:
             timeout: Timeout in seconds for HTTP requests
             error_handler: ErrorHandler instance for error management
+            session: HTTP session to fetch pages with (one is created if omitted)
         """
         self.timeout = timeout
         self.error_handler = error_handler or ErrorHandler()
+        self.session = session or create_session()
         # self.logger = logging.getLogger(__name__)
         
     def fetch_page(self, url: str, allow_redirects: bool = True) -> str:
@@ -43,17 +80,7 @@ class WebScraper:
         Retrieve web page content using requests with retry logic.
         """
         def _fetch_with_requests():
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Cache-Control': 'no-cache, no-store, must-revalidate',
-                'Pragma': 'no-cache',
-                'Expires': '0'
-            }
-            response = requests.get(url, headers=headers, timeout=self.timeout, allow_redirects=allow_redirects)
+            response = self.session.get(url, timeout=self.timeout, allow_redirects=allow_redirects)
             
             # If redirects are disabled and we got a redirect, treat as 404/Unavailable
             if not allow_redirects and 300 <= response.status_code < 400:
@@ -79,10 +106,10 @@ class WebScraper:
                         date_obj = datetime.date.today()
                     self.error_handler.handle_network_error(http_error, url, comic_name, date_obj)
             # self.logger.error(f"Request failed for {url}: {e}")
-            raise WebScrapingError(f"Failed to fetch {url}: {e}")
+            raise WebScrapingError(f"Failed to fetch {url}: {e}") from e
         except RequestException as e:
             # self.logger.error(f"Request failed for {url}: {e}")
-            raise WebScrapingError(f"Failed to fetch {url}: {e}")
+            raise WebScrapingError(f"Failed to fetch {url}: {e}") from e
         except Exception as e:
             # self.logger.error(f"Unexpected error fetching {url}: {e}")
             raise WebScrapingError(f"Unexpected error fetching {url}: {e}")
@@ -8,63 +8,92 @@ error management, and state synchronization.
 
 # import logging
 from datetime import date, datetime
-from typing import Optional
-from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+from typing import Callable, Optional
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import QMessageBox
 
 from models.data_models import ComicData, get_comic_definition
-from services.comic_service import ComicService, ComicServiceError
+from services.comic_service import ComicService, ComicServiceError, ComicNotAvailableError
 from services.error_handler import ComicUnavailableError, NetworkError, ParsingError
 
 
-class ComicLoadingWorker(QThread):
+class ComicLoadingSignals(QObject):
     """
-    Background worker thread for loading comics without blocking the UI.
+    Signals for ComicLoadingTask (a QRunnable cannot emit signals itself).
+
+    Every signal carries the id of the load request it belongs to, so the
+    controller can drop results of requests that were superseded.
+    """
+
+    comic_loaded = pyqtSignal(int, ComicData)  # request_id, loaded comic
+    loading_failed = pyqtSignal(int, Exception)  # request_id, error
+    loading_progress = pyqtSignal(int, str)  # request_id, progress message
+
+    def __init__(self):
+        """Initialize the signal holder."""
+        super().__init__()
+        # Id of the most recent request; queued older requests are skipped.
+        # Written by the GUI thread, read by the pool thread.
+        self.latest_request_id = 0
+
+
+class ComicLoadingTask(QRunnable):
+    """
+    Thread pool task for loading comics without blocking the UI.
     
-    This worker handles comic retrieval operations in a separate thread
+    This task handles comic retrieval operations in a pool thread
     to keep the UI responsive during network operations.
     """
     
-    # Signals for communicating with the main thread
-    comic_loaded = pyqtSignal(ComicData)  # Emitted when comic is successfully loaded
-    loading_failed = pyqtSignal(Exception)  # Emitted when loading fails
-    loading_progress = pyqtSignal(str)  # Emitted with progress messages
-    
-    def __init__(self, comic_service: ComicService, comic_name: str, comic_date: date):
+    def __init__(self, comic_service: ComicService, comic_name: str, comic_date: date,
+                 request_id: int, signals: ComicLoadingSignals,
+                 shared_load: Optional[Callable[[str, date], ComicData]] = None):
         """
-        Initialize the comic loading worker.
+        Initialize the comic loading task.
         
         Args:
             comic_service: ComicService instance for comic retrieval
             comic_name: Name of the comic to load
             comic_date: Date of the comic to load
+            request_id: Id of the load request, echoed back in the signals
+            signals: Shared signal holder used to report results
+            shared_load: Loads a comic on the calling thread, sharing the
+                fetch with background ones; get_comic is called directly if None
         """
         super().__init__()
         self.comic_service = comic_service
+        self.shared_load = shared_load
         self.comic_name = comic_name
         self.comic_date = comic_date
+        self.request_id = request_id
+        self.signals = signals
         # self.logger = logging.getLogger(__name__)
     
     def run(self):
-        """Load the comic in the background thread."""
+        """Load the comic in a pool thread."""
+        if self.request_id != self.signals.latest_request_id:
+            return  # Superseded while waiting in the queue
         try:
-            self.loading_progress.emit("Checking cache...")
+            self.signals.loading_progress.emit(self.request_id, "Checking cache...")
             
             # Check if comic is cached first
             if self.comic_service.is_comic_cached(self.comic_name, self.comic_date):
-                self.loading_progress.emit("Loading from cache...")
+                self.signals.loading_progress.emit(self.request_id, "Loading from cache...")
             else:
-                self.loading_progress.emit("Downloading comic...")
+                self.signals.loading_progress.emit(self.request_id, "Downloading comic...")
             
-            # Load the comic
-            comic_data = self.comic_service.get_comic(self.comic_name, self.comic_date)
+            # Load the comic, joining a prefetch or search already fetching it
+            if self.shared_load is not None:
+                comic_data = self.shared_load(self.comic_name, self.comic_date)
+            else:
+                comic_data = self.comic_service.get_comic(self.comic_name, self.comic_date)
             
-            self.loading_progress.emit("Comic loaded successfully")
-            self.comic_loaded.emit(comic_data)
+            self.signals.loading_progress.emit(self.request_id, "Comic loaded successfully")
+            self.signals.comic_loaded.emit(self.request_id, comic_data)
             
         except Exception as e:
             # self.logger.error(f"Failed to load comic {self.comic_name} for {self.comic_date}: {e}")
-            self.loading_failed.emit(e)
+            self.signals.loading_failed.emit(self.request_id, e)
 
 
 class ComicController(QObject):
@@ -99,7 +128,22 @@ class ComicController(QObject):
         # Current state
         self.current_comic_name: Optional[str] = None
         self.current_date: Optional[date] = None
-        self.loading_worker: Optional[ComicLoadingWorker] = None
+
+        # Loads run one at a time in a pool thread, so they finish in the
+        # order they were requested and queued ones can be skipped once a
+        # newer request exists; a newer request never waits for an older one
+        # on the GUI thread, the older result is simply dropped.
+        self._request_id = 0
+        self._load_pool = QThreadPool(self)
+        self._load_pool.setMaxThreadCount(1)
+        self._load_signals = ComicLoadingSignals()
+        self._load_signals.comic_loaded.connect(self._on_comic_loaded)
+        self._load_signals.loading_failed.connect(self._on_loading_failed)
+        self._load_signals.loading_progress.connect(self._on_loading_progress)
+
+        # Set by the owner to share in-flight fetches with its background
+        # fetches (see ComicLoadingTask)
+        self.shared_load: Optional[Callable[[str, date], ComicData]] = None
     
     def select_comic(self, comic_name: str):
         """
@@ -137,10 +181,9 @@ class ComicController(QObject):
             comic_name: Name of the comic to load
             comic_date: Date of the comic to load
         """
-        # Cancel any existing loading operation
-        if self.loading_worker and self.loading_worker.isRunning():
-            self.loading_worker.quit()
-            self.loading_worker.wait()
+        # Supersede any existing loading operation
+        self._request_id += 1
+        self._load_signals.latest_request_id = self._request_id
         
         # Check if comic service is available
         if not self.comic_service:
@@ -165,33 +208,40 @@ class ComicController(QObject):
         # Emit loading started signal
         self.comic_loading_started.emit(comic_name, comic_date)
         
-        # Start loading in background thread
-        self.loading_worker = ComicLoadingWorker(self.comic_service, comic_name, comic_date)
-        self.loading_worker.comic_loaded.connect(self._on_comic_loaded)
-        self.loading_worker.loading_failed.connect(self._on_loading_failed)
-        self.loading_worker.loading_progress.connect(self._on_loading_progress)
-        self.loading_worker.start()
+        # Start loading in a pool thread
+        self._load_pool.start(ComicLoadingTask(
+            self.comic_service, comic_name, comic_date, self._request_id, self._load_signals,
+            self.shared_load
+        ))
     
-    @pyqtSlot(ComicData)
-    def _on_comic_loaded(self, comic_data: ComicData):
+    @pyqtSlot(int, ComicData)
+    def _on_comic_loaded(self, request_id: int, comic_data: ComicData):
         """
         Handle successful comic loading.
 
         Args:
+            request_id: Id of the load request
             comic_data: Loaded comic data
         """
+        if request_id != self._request_id:
+            return  # A newer request has been made since
+        
         # Emit signals
         self.comic_loaded.emit(comic_data)
         self.comic_loading_finished.emit(comic_data.comic_name, comic_data.date)
     
-    @pyqtSlot(Exception)
-    def _on_loading_failed(self, error: Exception):
+    @pyqtSlot(int, Exception)
+    def _on_loading_failed(self, request_id: int, error: Exception):
         """
         Handle comic loading failure.
         
         Args:
+            request_id: Id of the load request
             error: Exception that occurred during loading
         """
+        if request_id != self._request_id:
+            return  # A newer request has been made since
+        
         # self.logger.error(f"Comic loading failed: {error}")
         
         # Determine error type for appropriate UI handling
@@ -220,7 +270,7 @@ class ComicController(QObject):
         """
         error_str = str(error).lower()
 
-        if isinstance(error, ComicUnavailableError):
+        if isinstance(error, (ComicUnavailableError, ComicNotAvailableError)):
             return "unavailable"
         elif isinstance(error, NetworkError):
             return "network"
@@ -244,12 +294,13 @@ class ComicController(QObject):
         else:
             return "general"
     
-    @pyqtSlot(str)
-    def _on_loading_progress(self, progress_message: str):
+    @pyqtSlot(int, str)
+    def _on_loading_progress(self, request_id: int, progress_message: str):
         """
         Handle loading progress updates.
         
         Args:
+            request_id: Id of the load request
             progress_message: Progress message to display
         """
         # self.logger.debug(f"Loading progress: {progress_message}")
@@ -307,6 +358,7 @@ class ComicController(QObject):
     
     def cleanup(self):
         """Clean up resources when the controller is destroyed."""
-        if self.loading_worker and self.loading_worker.isRunning():
-            self.loading_worker.quit()
-            self.loading_worker.wait()
\ No newline at end of file
+        self._load_signals.latest_request_id = -1  # Skip anything still queued
+        self._load_pool.clear()
+        self._load_pool.waitForDone()
+        self.comic_service.close()
\ No newline at end of file
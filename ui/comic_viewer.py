@@ -5,84 +5,351 @@ This module contains the ComicViewer widget which displays comic strips with
 proper scaling, title information, loading states, and error handling.
 """
 
+import mmap
 import os
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
 from typing import Optional
+
+import requests
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea,
-    QFrame, QPushButton, QProgressBar, QSizePolicy
+    QFrame, QPushButton, QSizePolicy
+)
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QSize, QThread, pyqtSlot, QObject, QRunnable, QThreadPool, QTimer
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QThread, pyqtSlot
-from PyQt6.QtGui import QPixmap, QFont, QPainter, QMovie, QImage
+from PyQt6.QtGui import QPixmap, QPixmapCache, QFont, QPainter, QImage, QPen, QColor, QTransform
 from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 
 from models.data_models import ComicData, get_comic_definition
 
 
-class ImageLoader(QThread):
+# Minimum progress step (percent) and interval between progress signals
+PROGRESS_MIN_STEP = 2
+PROGRESS_MIN_INTERVAL_NS = 50_000_000
+
+# Size limit of the application-wide QPixmapCache (in KB), the one cache of
+# decoded comics, for instant Previous/Next display; set once by main.py
+PIXMAP_CACHE_LIMIT_KB = 64 * 1024
+
+# Quiet period after the last resize before the image is re-scaled smoothly
+IDLE_RESCALE_MS = 150
+
+# Longest wait (ms) on cleanup for running prefetch decodes to finish
+CLOSE_WAIT_MS = 3000
+
+# Loading spinner: size in pixels, rotation step in degrees, ~16 fps
+SPINNER_SIZE = 32
+SPINNER_STEP = 22
+SPINNER_INTERVAL_MS = 62
+
+_spinner_pixmap: Optional[QPixmap] = None
+
+
+def get_spinner_pixmap() -> QPixmap:
+    """Draw the loading spinner once per process (needs a QApplication)."""
+    global _spinner_pixmap
+    if _spinner_pixmap is None:
+        pixmap = QPixmap(SPINNER_SIZE, SPINNER_SIZE)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        pen = QPen(QColor("#757575"), 3)
+        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        painter.setPen(pen)
+        # 270° arc; angles are in 1/16 degree
+        painter.drawArc(3, 3, SPINNER_SIZE - 6, SPINNER_SIZE - 6, 0, 270 * 16)
+        painter.end()
+        _spinner_pixmap = pixmap
+    return _spinner_pixmap
+
+# --- Stylesheets ---
+# Built once per process; state transitions only swap these prebuilt strings.
+_VIEWER_QSS = """
+    QWidget {
+        background-color: #e8e8e8;
+    }
+    QLabel {
+        color: #000000;
+        background-color: transparent;
+    }
+    QPushButton#nav {
+        background-color: #e0e0e0;
+        color: #000000;
+        border: 2px solid #bdbdbd;
+        border-radius: 4px;
+        padding: 6px 12px;
+    }
+    QPushButton#nav:hover {
+        background-color: #d0d0d0;
+        border: 2px solid #9e9e9e;
+    }
+    QPushButton#nav:pressed {
+        background-color: #bdbdbd;
+        border: 2px solid #757575;
+    }
+"""
+
+_IMAGE_QSS = """
+    QLabel {
+        border: 1px solid #e0e0e0;
+        border-radius: 8px;
+        background-color: #fafafa;
+    }
+"""
+
+_IMAGE_SHOWN_QSS = """
+    QLabel {
+        border: none;
+        border-radius: 8px;
+        background-color: transparent;
+    }
+"""
+
+_LOADING_QSS = """
+    QLabel {
+        border: 1px solid #e0e0e0;
+        border-radius: 8px;
+        background-color: #f8f9fa;
+        color: #000000;
+        font-size: 16px;
+        font-family: "Noto Sans", "Segoe UI", Arial, sans-serif;
+    }
+"""
+
+_EMPTY_QSS = """
+    QLabel {
+        border: 1px solid #595959;
+        border-radius: 8px;
+        background-color: #faeeae;
+        padding: 20px;
+    }
+"""
+
+_STATUS_QSS = """
+    QLabel {
+        color: #000000;
+        font-size: 16px;
+        font-family: "Noto Sans", "Segoe UI", Arial, sans-serif;
+        }
+"""
+
+_ERROR_QSS_TMPL = """
+    QLabel {{
+        border: 1px solid {border_color};
+        border-radius: 8px;
+        background-color: {bg_color};
+        color: {text_color};
+        font-size: 22px;
+        font-family: "Noto Sans", "Segoe UI", Arial, sans-serif;
+    }}
+"""
+
+_ERROR_STATUS_QSS_TMPL = """
+    QLabel {{
+        color: {text_color};
+        font-size: 18px;
+        padding: 10px;
+        background-color: {bg_color};
+        border-radius: 4px;
+        margin: 5px;
+        font-family: "Noto Sans", "Segoe UI", Arial, sans-serif;
+    }}
+"""
+
+
+def _error_state(icon: str, title: str, bg_color: str, border_color: str, text_color: str = "#000000") -> tuple:
+    """Build the (icon, title, image QSS, status QSS) tuple for an error type."""
+    colors = dict(bg_color=bg_color, border_color=border_color, text_color=text_color)
+    return (icon, title, _ERROR_QSS_TMPL.format(**colors), _ERROR_STATUS_QSS_TMPL.format(**colors))
+
+
+# Error type -> (icon, title, image label QSS, status label QSS)
+_ERROR_STATES = {
+    "network": _error_state("⛔", "Connection Error", "#fff3cd", "#ffeaa7"),
+    "unavailable": _error_state("😵", "Comic Not Available", "#d1ecf1", "#bee5eb"),
+    "parsing": _error_state("⧗", "Loading Issue", "#f8d7da", "#f5c6cb"),
+}
+_DEFAULT_ERROR_STATE = _error_state("⚠️", "Error", "#f8d7da", "#dc3545")
+
+
+def advise_readahead(path: str):
     """
-    Background thread for loading comic images without blocking the UI.
-    
-    This thread handles downloading images from URLs or loading from cache,
-    with proper error handling and progress reporting.
+    Ask the kernel to start reading a file into the page cache asynchronously.
+
+    The reads for all prefetch candidates are queued at once and proceed in
+    parallel, so the decode threads later find the data already in memory.
+    This is a no-op where posix_fadvise is unavailable (e.g. Windows).
+
+    Args:
+        path: File path to read ahead
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class ImageLoaderWorker(QObject):
+    """
+    Worker for loading comic images without blocking the UI.
+
+    A single worker lives on a persistent background thread and receives
+    load jobs through the load_requested signal, so no thread is created or
+    joined per comic. Every job carries an id; results are tagged with it so
+    the viewer can drop results of jobs it no longer cares about.
     """
     
-    # Signals for communicating with the main thread
-    image_loaded = pyqtSignal(QPixmap)  # Emitted when image is successfully loaded
-    loading_failed = pyqtSignal(str)    # Emitted when loading fails with error message
-    loading_progress = pyqtSignal(int)  # Emitted with progress percentage
+    # Queued job: image_source (file path or URL), job_id
+    load_requested = pyqtSignal(str, int)
+
+    # Signals for communicating with the main thread.
+    # Images cross the thread boundary as QImage: QPixmap is a GUI-thread
+    # object and must only be created there (see ComicViewer slots).
+    image_loaded = pyqtSignal(int, str, QImage)   # job_id, image_source, decoded image
+    loading_failed = pyqtSignal(int, str)         # job_id, error message
+    loading_progress = pyqtSignal(int, int)       # job_id, progress percentage
+    
+    def __init__(self):
+        """Initialize the image loader worker."""
+        super().__init__()
+        # Id of the most recent job; older queued jobs are skipped.
+        # Written by the GUI thread, read by the worker thread.
+        self.latest_job_id = 0
+        self._last_progress = -PROGRESS_MIN_STEP
+        self._last_progress_ns = 0
+        self.load_requested.connect(self.load)
     
-    def __init__(self, image_source: str):
+    @pyqtSlot(str, int)
+    def load(self, image_source: str, job_id: int):
         """
-        Initialize the image loader.
-        
+        Load an image in the worker thread.
+
         Args:
             image_source: Either a file path (for cached images) or URL (for web images)
+            job_id: Id of the job, echoed back in the result signals
         """
-        super().__init__()
-        self.image_source = image_source
-        self.network_manager = None
-    
-    def run(self):
-        """Load the image in the background thread."""
+        if job_id != self.latest_job_id:
+            return  # Superseded while waiting in the queue
+        self._last_progress = -PROGRESS_MIN_STEP
+        self._last_progress_ns = 0
+
         try:
-            if self.image_source.startswith(('https://', 'http://')):
-                self._load_from_url()
+            if image_source.startswith(('https://', 'http://')):
+                self._load_from_url(image_source, job_id)
             else:
-                self._load_from_file()
+                self._load_from_file(image_source, job_id)
         except Exception as e:
-            self.loading_failed.emit(f"Failed to load image: {str(e)}")
+            self.loading_failed.emit(job_id, f"Failed to load image: {str(e)}")
     
-    def _load_from_file(self):
+    def _load_from_file(self, image_source: str, job_id: int):
         """Load image from local file path."""
-        if not os.path.exists(self.image_source):
-            self.loading_failed.emit("Image file not found")
+        # Open once instead of stat-then-open; a missing file shows up as ENOENT
+        try:
+            fd = os.open(image_source, os.O_RDONLY)
+        except FileNotFoundError:
+            self.loading_failed.emit(job_id, "Image file not found")
             return
-        
-        pixmap = QPixmap(self.image_source)
-        if pixmap.isNull():
-            self.loading_failed.emit("Invalid image file format")
+
+        image = QImage()
+        try:
+            # Decode straight from the page cache; mmap refuses empty files
+            if os.fstat(fd).st_size > 0:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                    image.loadFromData(mapped)
+        finally:
+            os.close(fd)
+
+        if image.isNull():
+            self.loading_failed.emit(job_id, "Invalid image file format")
             return
-        
-        self.image_loaded.emit(pixmap)
+
+        self.image_loaded.emit(job_id, image_source, image)
     
-    def _load_from_url(self):
+    def _load_from_url(self, image_source: str, job_id: int):
         """Load image from URL using requests."""
         try:
-            import requests
-            response = requests.get(self.image_source, timeout=30)
+            response = requests.get(image_source, timeout=30, stream=True)
             response.raise_for_status()
+
+            total = int(response.headers.get('Content-Length') or 0)
+            data = bytearray()
+            for chunk in response.iter_content(chunk_size=16384):
+                data.extend(chunk)
+                if total:
+                    self._report_progress(job_id, min(100, len(data) * 100 // total))
+
+            image = QImage()
+            image.loadFromData(bytes(data))
             
-            pixmap = QPixmap()
-            pixmap.loadFromData(response.content)
-            
-            if pixmap.isNull():
-                self.loading_failed.emit("Failed to parse image data from URL")
+            if image.isNull():
+                self.loading_failed.emit(job_id, "Failed to parse image data from URL")
                 return
-                
-            self.image_loaded.emit(pixmap)
+
+            self.image_loaded.emit(job_id, image_source, image)
         except Exception as e:
-            self.loading_failed.emit(f"Failed to download image: {str(e)}")
+            self.loading_failed.emit(job_id, f"Failed to download image: {str(e)}")
+
+    def _report_progress(self, job_id: int, progress: int):
+        """
+        Emit loading_progress, throttled so the GUI repaints at most ~20 times a second.
+
+        Args:
+            job_id: Id of the job the progress belongs to
+            progress: Progress percentage (0-100)
+        """
+        now = time.monotonic_ns()
+        if (progress - self._last_progress >= PROGRESS_MIN_STEP
+                or now - self._last_progress_ns > PROGRESS_MIN_INTERVAL_NS):
+            self.loading_progress.emit(job_id, progress)
+            self._last_progress = progress
+            self._last_progress_ns = now
+
 
+class PrefetchSignals(QObject):
+    """Signals for ImagePrefetchTask (a QRunnable cannot emit signals itself)."""
+
+    image_prefetched = pyqtSignal(str, QImage)  # image_source, decoded image
+
+
+class ImagePrefetchTask(QRunnable):
+    """
+    Thread pool task that decodes a cached comic image ahead of time.
+
+    Only local files are prefetched; the result is handed back to the viewer
+    so that a later Previous/Next click can be displayed without a decode.
+    """
+
+    def __init__(self, image_source: str, signals: PrefetchSignals):
+        """
+        Initialize the prefetch task.
+
+        Args:
+            image_source: File path of the cached image to decode
+            signals: Signal holder living in the GUI thread
+        """
+        super().__init__()
+        self.image_source = image_source
+        self.signals = signals
+
+    def run(self):
+        """Decode the image in a pool thread."""
+        try:
+            image = QImage(self.image_source)
+        except Exception:
+            image = QImage()  # Prefetching is best-effort
+        # Always report back so the viewer can clear its pending entry
+        self.signals.image_prefetched.emit(self.image_source, image)
 
 
 class ComicViewer(QWidget):
@@ -107,17 +374,38 @@ class ComicViewer(QWidget):
         super().__init__(parent)
         self.current_comic_data = None
         self.current_pixmap = None
-        self.image_loader = None
+        # (cacheKey, width, height, dpr) of the pixmap currently on screen
+        self._last_scale_key: Optional[tuple] = None
+
+        # Persistent image loading thread; jobs are queued via signals
+        self._current_job_id = 0
+        self._loader_worker = ImageLoaderWorker()
+        self._loader_thread = QThread()
+        self._loader_worker.moveToThread(self._loader_thread)
+        self._loader_worker.image_loaded.connect(self._on_worker_image_loaded)
+        self._loader_worker.loading_failed.connect(self._on_worker_loading_failed)
+        self._loader_worker.loading_progress.connect(self._on_worker_loading_progress)
+        self._loader_thread.start()
+
+        # Background decoding of neighbouring comics
+        self._prefetch_pool = QThreadPool(self)
+        self._prefetch_pool.setMaxThreadCount(3)
+        self._prefetch_signals = PrefetchSignals()
+        self._prefetch_signals.image_prefetched.connect(self._on_image_prefetched)
+        self._prefetch_pending = set()
+
+        # While the window is being resized, scale with the fast transformation
+        # and redo it smoothly once resizing has been idle for a moment.
+        self._interactive = False
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(IDLE_RESCALE_MS)
+        self._idle_timer.timeout.connect(self._on_interaction_idle)
+        # Set while a splitter is dragged: resizes keep the scaled image as is
+        self._rescale_held = False
+
         self.setup_ui()
-        self.setStyleSheet("""
-                QWidget {
-                 background-color: #e8e8e8;
-                }
-                QLabel {
-                 color: #000000;
-                 background-color: transparent;
-                }
-        """)        
+        self.setStyleSheet(_VIEWER_QSS)
     
     def setup_ui(self):
         """Set up the main UI layout and components."""
@@ -219,48 +507,30 @@ class ComicViewer(QWidget):
         nav_layout.setSpacing(10)
         nav_layout.setContentsMargins(0, 0, 0, 0)  # Remove margins to prevent artifacts
 
-        # --- Button style ---
-        btn_style = """
-            QPushButton {
-                background-color: #e0e0e0;
-                color: #000000;
-                border: 2px solid #bdbdbd;
-                border-radius: 4px;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background-color: #d0d0d0;
-                border: 2px solid #9e9e9e;
-            }
-            QPushButton:pressed {
-                background-color: #bdbdbd;
-                border: 2px solid #757575;
-            }
-        """
-
+        # Buttons are styled by the QPushButton#nav rule in _VIEWER_QSS
         # First button
         self.first_button = QPushButton("First")
-        self.first_button.setStyleSheet(btn_style)
+        self.first_button.setObjectName("nav")
         nav_layout.addWidget(self.first_button)
 
         # Previous button
         self.prev_button = QPushButton("Previous")
-        self.prev_button.setStyleSheet(btn_style)
+        self.prev_button.setObjectName("nav")
         nav_layout.addWidget(self.prev_button)
 
         # Today button
         self.today_button = QPushButton("Today")
-        self.today_button.setStyleSheet(btn_style)
+        self.today_button.setObjectName("nav")
         nav_layout.addWidget(self.today_button)
 
         # Next button
         self.next_button = QPushButton("Next")
-        self.next_button.setStyleSheet(btn_style)
+        self.next_button.setObjectName("nav")
         nav_layout.addWidget(self.next_button)
 
         # Random button
         self.random_button = QPushButton("Random")
-        self.random_button.setStyleSheet(btn_style)
+        self.random_button.setObjectName("nav")
         nav_layout.addWidget(self.random_button)
 
         self.content_layout.addLayout(nav_layout)
@@ -269,52 +539,126 @@ class ComicViewer(QWidget):
         self.image_label = QLabel()
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.image_label.setMinimumSize(QSize(400, 300))
-        self.image_label.setStyleSheet("""
-            QLabel {
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-                background-color: #fafafa;
-            }
-        """)
+        self.image_label.setStyleSheet(_IMAGE_QSS)
         # Point 3: Explicitly set the centered flag
         self.content_layout.addWidget(self.image_label, 0, Qt.AlignmentFlag.AlignHCenter)
 
         # Stretch at the end pushes all content to the top
         self.content_layout.addStretch()
 
-        # Loading progress bar
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setVisible(False)
-        self.progress_bar.setMaximumWidth(300)
-        self.progress_bar.setMaximumHeight(0)  # Collapse when hidden to prevent artifacts
-        self.progress_bar.hide()  # Explicitly hide initially
-        self.content_layout.addWidget(self.progress_bar)
-
-        # Error/status message area
-        self.status_label = QLabel()
-        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setWordWrap(True)
-
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 16px;
-                font-family: "Noto Sans", "Segoe UI", Arial, sans-serif;
-                }
-        """)
-        self.status_label.setVisible(False)  # Hide when empty
-        self.content_layout.addWidget(self.status_label)
-
-        # Retry button for error states
-        self.retry_button = QPushButton("Retry")
-        self.retry_button.setVisible(False)
-        self.retry_button.setMaximumWidth(100)
-        self.retry_button.clicked.connect(self.retry_loading)
-        self.content_layout.addWidget(self.retry_button)
+        # Spinner, status label and retry button are created on first
+        # use (see _ensure_* below); they are hidden most of the time.
+        self._spinner_label = None
+        self._spinner_timer = None
+        self._spinner_angle = 0
+        self._status_label = None
+        self._retry_button = None
 
         self.scroll_area.setWidget(self.content_widget)
         parent_layout.addWidget(self.scroll_area)
     
+    def _insert_lazy_widget(self, widget: QWidget, order: int):
+        """
+        Insert a lazily created widget below the image, keeping a fixed order.
+
+        Args:
+            widget: Widget to insert
+            order: Position among the lazy widgets (spinner, status, retry)
+        """
+        # Layout: nav buttons, image label, stretch, then the lazy widgets
+        lazy_widgets = (self._spinner_label, self._status_label, self._retry_button)
+        index = 3 + sum(1 for w in lazy_widgets[:order] if w is not None)
+        self.content_layout.insertWidget(index, widget)
+
+    def _ensure_spinner_label(self) -> QLabel:
+        """Create the loading spinner and its animation timer on first use."""
+        if self._spinner_label is None:
+            spinner_label = QLabel()
+            spinner_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            # Room for the rotated pixmap's bounding box, so the layout stays still
+            spinner_label.setFixedSize(QSize(SPINNER_SIZE * 3 // 2, SPINNER_SIZE * 3 // 2))
+            spinner_label.setVisible(False)
+            self._insert_lazy_widget(spinner_label, 0)
+            self._spinner_label = spinner_label
+
+            self._spinner_timer = QTimer(self)
+            self._spinner_timer.setInterval(SPINNER_INTERVAL_MS)
+            self._spinner_timer.timeout.connect(self._rotate_spinner)
+        return self._spinner_label
+
+    def _start_spinner(self):
+        """Show the loading spinner and start animating it."""
+        spinner_label = self._ensure_spinner_label()
+        self._spinner_angle = 0
+        spinner_label.setPixmap(get_spinner_pixmap())
+        spinner_label.setVisible(True)
+        self._spinner_timer.start()
+
+    def _stop_spinner(self):
+        """Stop and hide the loading spinner if it exists."""
+        if self._spinner_label is not None:
+            self._spinner_timer.stop()
+            self._spinner_label.setVisible(False)
+
+    def _rotate_spinner(self):
+        """Advance the spinner animation by one frame."""
+        self._spinner_angle = (self._spinner_angle + SPINNER_STEP) % 360
+        self._spinner_label.setPixmap(
+            get_spinner_pixmap().transformed(
+                QTransform().rotate(self._spinner_angle),
+                Qt.TransformationMode.SmoothTransformation
+            )
+        )
+
+    def _ensure_status_label(self) -> QLabel:
+        """Create the error/status message label on first use."""
+        if self._status_label is None:
+            status_label = QLabel()
+            status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            status_label.setWordWrap(True)
+            status_label.setStyleSheet(_STATUS_QSS)
+            status_label.setVisible(False)  # Hide when empty
+            self._insert_lazy_widget(status_label, 1)
+            self._status_label = status_label
+        return self._status_label
+
+    def _ensure_retry_button(self) -> QPushButton:
+        """Create the retry button for error states on first use."""
+        if self._retry_button is None:
+            retry_button = QPushButton("Retry")
+            retry_button.setVisible(False)
+            retry_button.setMaximumWidth(100)
+            retry_button.clicked.connect(self.retry_loading)
+            self._insert_lazy_widget(retry_button, 2)
+            self._retry_button = retry_button
+        return self._retry_button
+
+    @contextmanager
+    def _batch_updates(self):
+        """
+        Suspend repaints while several widgets are updated, then paint once.
+
+        Nested use is a no-op so that only the outermost block repaints.
+        """
+        if not self.updatesEnabled():
+            yield
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _hide_status_widgets(self, hide_status: bool = True):
+        """Stop the spinner and hide whichever of the status label and retry button exist."""
+        self._stop_spinner()
+        if hide_status and self._status_label is not None:
+            self._status_label.setText("")
+            self._status_label.setVisible(False)
+        if self._retry_button is not None:
+            self._retry_button.setVisible(False)
+
     def display_comic(self, comic_data: ComicData):
         """
         Display a comic strip with its metadata.
@@ -327,8 +671,10 @@ class ComicViewer(QWidget):
         # Update header with comic information
         self.update_header(comic_data)
         
-        # Start loading the comic image
-        self.show_loading_state()
+        # Start loading the comic image; an already decoded one is shown
+        # straight away, without flashing the loading state
+        if QPixmapCache.find(self._image_source(comic_data)) is None:
+            self.show_loading_state()
         self.load_comic_image(comic_data)
     
     def update_header(self, comic_data: ComicData):
@@ -342,15 +688,14 @@ class ComicViewer(QWidget):
         # Format: "Comic Name • Month Day, Year"
         comic_def = get_comic_definition(comic_data.comic_name)
         display_name = comic_def.display_name if comic_def else comic_data.comic_name
-        date_str = comic_data.date.strftime("%B %d, %Y")
-        self.title_label.setText(f"{display_name} • {date_str}")
+        self._set_label_text(self.title_label, f"{display_name} • {comic_data.display_date}")
 
         # Author info
         if comic_def and comic_def.author:
-            self.author_label.setText(comic_def.author)
+            self._set_label_text(self.author_label, comic_def.author)
             self.author_label.setVisible(True)
         else:
-            self.author_label.setText("")
+            self._set_label_text(self.author_label, "")
             self.author_label.setVisible(False)
 
         # Set metadata information
@@ -367,8 +712,14 @@ class ComicViewer(QWidget):
             dpr = 1.0
         metadata_text += f"  @ {int(dpr * 100)}%"
 
-        self.metadata_label.setText(metadata_text)
+        self._set_label_text(self.metadata_label, metadata_text)
         self.metadata_label.setVisible(True)  # Show metadata when we have content
+
+    @staticmethod
+    def _set_label_text(label: QLabel, text: str):
+        """Set a label's text only if it changed (setText always re-lays out the header)."""
+        if label.text() != text:
+            label.setText(text)
     
     def load_comic_image(self, comic_data: ComicData):
         """
@@ -379,20 +730,40 @@ class ComicViewer(QWidget):
         """
         self.loading_started.emit()
         
-        # Determine image source (cached file or URL)
-        image_source = comic_data.cached_image_path if comic_data.cached_image_path else comic_data.image_url
+        image_source = self._image_source(comic_data)
         
-        # Clean up previous loader
-        if self.image_loader:
-            self.image_loader.quit()
-            self.image_loader.wait()
+        # New job: results of any earlier job are ignored from now on
+        self._current_job_id += 1
+        self._loader_worker.latest_job_id = self._current_job_id
+        
+        # Already decoded (previously shown or prefetched): skip the thread entirely
+        cached_pixmap = QPixmapCache.find(image_source)
+        if cached_pixmap is not None:
+            self.on_image_loaded(cached_pixmap)
+            return
         
-        # Start loading in background thread
-        self.image_loader = ImageLoader(image_source)
-        self.image_loader.image_loaded.connect(self.on_image_loaded)
-        self.image_loader.loading_failed.connect(self.on_loading_failed)
-        self.image_loader.loading_progress.connect(self.on_loading_progress)
-        self.image_loader.start()
+        # Queue the job on the background loader thread
+        self._loader_worker.load_requested.emit(image_source, self._current_job_id)
+
+    @pyqtSlot(int, str, QImage)
+    def _on_worker_image_loaded(self, job_id: int, image_source: str, image: QImage):
+        """Convert a decoded image and show it unless a newer job has been started since."""
+        pixmap = QPixmap.fromImage(image)
+        self._remember_pixmap(image_source, pixmap)
+        if job_id == self._current_job_id:
+            self.on_image_loaded(pixmap)
+
+    @pyqtSlot(int, str)
+    def _on_worker_loading_failed(self, job_id: int, error_message: str):
+        """Forward a loading failure unless a newer job has been started since."""
+        if job_id == self._current_job_id:
+            self.on_loading_failed(error_message)
+
+    @pyqtSlot(int, int)
+    def _on_worker_loading_progress(self, job_id: int, progress: int):
+        """Forward loading progress of the current job."""
+        if job_id == self._current_job_id:
+            self.on_loading_progress(progress)
     
     @pyqtSlot(QPixmap)
     def on_image_loaded(self, pixmap: QPixmap):
@@ -418,6 +789,39 @@ class ComicViewer(QWidget):
 
         self.comic_displayed.emit(self.current_comic_data.comic_name)
     
+    def prefetch(self, image_source: Optional[str]):
+        """
+        Decode a cached comic image in the background so it can be shown instantly later.
+
+        Args:
+            image_source: File path of a cached comic image (URLs are ignored)
+        """
+        if not image_source or image_source.startswith(('https://', 'http://')):
+            return
+        if image_source in self._prefetch_pending or QPixmapCache.find(image_source) is not None:
+            return
+        self._prefetch_pending.add(image_source)
+        advise_readahead(image_source)
+        self._prefetch_pool.start(ImagePrefetchTask(image_source, self._prefetch_signals))
+
+    @pyqtSlot(str, QImage)
+    def _on_image_prefetched(self, image_source: str, image: QImage):
+        """Store an image decoded by the prefetch pool."""
+        self._prefetch_pending.discard(image_source)
+        if not image.isNull():
+            self._remember_pixmap(image_source, QPixmap.fromImage(image))
+
+    def _remember_pixmap(self, image_source: str, pixmap: QPixmap):
+        """Insert a decoded pixmap into QPixmapCache (which evicts by size)."""
+        if not image_source or pixmap.isNull():
+            return
+        QPixmapCache.insert(image_source, pixmap)
+
+    @staticmethod
+    def _image_source(comic_data: ComicData) -> str:
+        """Return the cached file path of a comic's image, or its URL if not cached."""
+        return comic_data.cached_image_path if comic_data.cached_image_path else comic_data.image_url
+
     @pyqtSlot(str)
     def on_loading_failed(self, error_message: str):
         """
@@ -437,7 +841,8 @@ class ComicViewer(QWidget):
         Args:
             progress: Progress percentage (0-100)
         """
-        self.progress_bar.setValue(progress)
+        status_label = self._ensure_status_label()
+        status_label.setText(f"Downloading comic image... {progress}%")
     
     def display_image(self, pixmap: QPixmap):
         """
@@ -450,12 +855,6 @@ class ComicViewer(QWidget):
             self.show_error_state("Invalid image data")
             return
 
-        # Convert indexed images to true-color to prevent muddy palette artifacts
-        img = pixmap.toImage()
-        if img.colorTable():
-            img = img.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
-        true_color_pixmap = QPixmap.fromImage(img)
-
         logical_size = self.calculate_display_size(pixmap.size())
 
         # Get DPR from the window (more reliable than the widget itself).
@@ -465,6 +864,24 @@ class ComicViewer(QWidget):
         if dpr < 1.0:
             dpr = 1.0
 
+        if self._interactive:
+            transformation = Qt.TransformationMode.FastTransformation
+        else:
+            transformation = Qt.TransformationMode.SmoothTransformation
+
+        # Same pixmap at the same size is already on screen (e.g. the burst of
+        # resize events during window creation): skip conversion and scaling.
+        scale_key = (pixmap.cacheKey(), logical_size.width(), logical_size.height(), dpr,
+                     transformation)
+        if scale_key == self._last_scale_key:
+            return
+
+        # Convert indexed images to true-color to prevent muddy palette artifacts
+        img = pixmap.toImage()
+        if img.colorTable():
+            img = img.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+        true_color_pixmap = QPixmap.fromImage(img)
+
         # Scale to PHYSICAL pixel size.
         # At 125% scaling: logical 800×600 → physical 1000×750.
         # setDevicePixelRatio(1.25) tells Qt this pixmap is high-density,
@@ -476,17 +893,17 @@ class ComicViewer(QWidget):
         scaled_pixmap = true_color_pixmap.scaled(
             physical_size,
             Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
+            transformation
         )
 
         scaled_pixmap.setDevicePixelRatio(dpr)
 
         self.image_label.setPixmap(scaled_pixmap)
         self.image_label.setFixedSize(logical_size)
+        self._last_scale_key = scale_key
 
         # Delay content resize to let Qt finish layout (prevents stale padding).
         # A zero-delay QTimer ensures this runs after the current event cycle.
-        from PyQt6.QtCore import QTimer
         QTimer.singleShot(0, self._resize_content_widget)
     
     def calculate_display_size(self, original_size: QSize) -> QSize:
@@ -494,15 +911,19 @@ class ComicViewer(QWidget):
         Calculate appropriate display size using the refined Scaling Hack.
         Strictly honors image pixels and prevents unwanted enlargement.
         """
-        viewport = self.scroll_area.viewport()
-        max_w = viewport.width() - 40
+        # Tiny viewports (e.g. during window creation) must not yield
+        # zero or negative sizes
+        max_w = max(1, self.scroll_area.viewport().width() - 40)
         
-        w = float(original_size.width())
-        h = float(original_size.height())
+        ow = original_size.width()
+        oh = original_size.height()
         
-        if w <= 0 or h <= 0:
+        if ow <= 0 or oh <= 0:
             return QSize(400, 300)
 
+        w = float(ow)
+        h = float(oh)
+
         # 1. Custom Scale Factor (Huge images only)
         if w > 1535 and w > h: # Landscape
             h *= (1200/w)
@@ -556,11 +977,14 @@ class ComicViewer(QWidget):
         # 3. Final Window Constraint (DOWNSCALING only)
         # We only shrink the image if it is wider than the window.
         # We NEVER enlarge it to fill the window space.
-        if w > max_w:
-            h *= (max_w / w)
-            w = max_w
+        # Integer cross-multiplication: no float division on every resize.
+        new_w = max(1, int(w))
+        new_h = max(1, int(h))
+        if new_w > max_w:
+            new_h = max(1, (new_h * max_w) // new_w)
+            new_w = max_w
             
-        return QSize(int(w), int(h))
+        return QSize(new_w, new_h)
 
     def _resize_content_widget(self):
         """
@@ -584,29 +1008,20 @@ class ComicViewer(QWidget):
 
     def show_loading_state(self):
         """Display loading state with progress indicator."""
-        self.image_label.clear()
-        self.image_label.setText("Loading comic...")
-        self.image_label.setStyleSheet("""
-            QLabel {
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-                background-color: #f8f9fa;
-                color: #000000;
-                font-size: 16px;
-                font-family: "Noto Sans", "Segoe UI", Arial, sans-serif;
-            }
-        """)
-
-        self.progress_bar.setVisible(True)
-        self.progress_bar.show()  # Explicitly show the progress bar
-        self.progress_bar.setRange(0, 0)  # Indeterminate progress
-        self.status_label.setText("Downloading comic image...")
-        self.status_label.setVisible(True)  # Show status when we have content
-        self.retry_button.setVisible(False)
-
-        # Delay content resize to let Qt finish layout
-        from PyQt6.QtCore import QTimer
-        QTimer.singleShot(0, self._resize_content_widget)
+        with self._batch_updates():
+            self.image_label.clear()
+            self._last_scale_key = None
+            self.image_label.setText("Loading comic...")
+            self.image_label.setStyleSheet(_LOADING_QSS)
+
+            self._hide_status_widgets(hide_status=False)
+            self._start_spinner()
+            status_label = self._ensure_status_label()
+            status_label.setText("Downloading comic image...")
+            status_label.setVisible(True)  # Show status when we have content
+
+            # Delay content resize to let Qt finish layout
+            QTimer.singleShot(0, self._resize_content_widget)
     
     def show_error_state(self, error_message: str, error_type: str = "general", recovery_options: list = None):
         """
@@ -617,67 +1032,27 @@ class ComicViewer(QWidget):
             error_type: Type of error (network, parsing, unavailable, etc.)
             recovery_options: List of recovery action labels
         """
-        self.image_label.clear()
+        with self._batch_updates():
+            self.image_label.clear()
+            self._last_scale_key = None
         
-        # Choose appropriate icon and styling based on error type
-        if error_type == "network":
-            icon = "⛔"
-            title = "Connection Error"
-            bg_color = "#fff3cd"
-            border_color = "#ffeaa7"
-            text_color = "#000000"
-        elif error_type == "unavailable":
-            icon = "😵"
-            title = "Comic Not Available"
-            bg_color = "#d1ecf1"
-            border_color = "#bee5eb"
-            text_color = "#000000"
-        elif error_type == "parsing":
-            icon = "⧗"
-            title = "Loading Issue"
-            bg_color = "#f8d7da"
-            border_color = "#f5c6cb"
-            text_color = "#000000"
-        else:
-            icon = "⚠️"
-            title = "Error"
-            bg_color = "#f8d7da"
-            border_color = "#dc3545"
-            text_color = "#000000"        
-
-        self.image_label.setText(f"{icon}\n{title}")
-        self.image_label.setStyleSheet(f"""
-            QLabel {{
-                border: 1px solid {border_color};
-                border-radius: 8px;
-                background-color: {bg_color};
-                color: {text_color};
-                font-size: 22px;
-                font-family: "Noto Sans", "Segoe UI", Arial, sans-serif;
-            }}
-        """)
+            # Choose appropriate icon and styling based on error type
+            icon, title, image_qss, status_qss = _ERROR_STATES.get(error_type, _DEFAULT_ERROR_STATE)
 
-        self.progress_bar.setVisible(False)
-        self.status_label.setText(error_message)
-        self.status_label.setVisible(True)  # Show status when we have error content
-        self.status_label.setStyleSheet(f"""
-            QLabel {{
-                color: {text_color};
-                font-size: 18px;
-                padding: 10px;
-                background-color: {bg_color};
-                border-radius: 4px;
-                margin: 5px;
-                font-family: "Noto Sans", "Segoe UI", Arial, sans-serif;
-            }}
-        """)
+            self.image_label.setText(f"{icon}\n{title}")
+            self.image_label.setStyleSheet(image_qss)
+
+            self._hide_status_widgets(hide_status=False)
+            status_label = self._ensure_status_label()
+            status_label.setText(error_message)
+            status_label.setVisible(True)  # Show status when we have error content
+            status_label.setStyleSheet(status_qss)
         
-        # Show recovery options
-        self._show_recovery_options(recovery_options or ["Retry"])
+            # Show recovery options
+            self._show_recovery_options(recovery_options or ["Retry"])
 
-        # Delay content resize to let Qt finish layout
-        from PyQt6.QtCore import QTimer
-        QTimer.singleShot(0, self._resize_content_widget)
+            # Delay content resize to let Qt finish layout
+            QTimer.singleShot(0, self._resize_content_widget)
 
     def _show_recovery_options(self, recovery_options: list):
         """
@@ -688,11 +1063,11 @@ class ComicViewer(QWidget):
         """
         # Don't show any recovery buttons - removed as per user request
         # Just make sure the old retry button is hidden
-        self.retry_button.setVisible(False)
+        if self._retry_button is not None:
+            self._retry_button.setVisible(False)
     
     def try_yesterday(self):
         """Try loading yesterday's comic."""
-        from datetime import date, timedelta
         if hasattr(self, 'error_recovery_callback'):
             yesterday = date.today() - timedelta(days=1)
             self.error_recovery_callback('try_date', yesterday)
@@ -718,16 +1093,18 @@ class ComicViewer(QWidget):
     
     def show_empty_state(self):
         """Display empty state when no comic is selected."""
-        self.image_label.clear()
-
-        # Build data URI for the 400x400 welcome image
-        icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "initial_transparent_alpha.png")
-        data_uri = ""
-        if os.path.exists(icon_path):
-            with open(icon_path, "rb") as f:
-                data_uri = "data:image/png;base64," + __import__("base64").b64encode(f.read()).decode()
-
-        self.image_label.setText(f"""
+        with self._batch_updates():
+            self.image_label.clear()
+            self._last_scale_key = None
+
+            # Build data URI for the 400x400 welcome image
+            icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "initial_transparent_alpha.png")
+            data_uri = ""
+            if os.path.exists(icon_path):
+                with open(icon_path, "rb") as f:
+                    data_uri = "data:image/png;base64," + __import__("base64").b64encode(f.read()).decode()
+
+            self.image_label.setText(f"""
         <html>
             <body style="text-align: center;">
                 <img src="{data_uri}" width="240" height="240">
@@ -736,39 +1113,20 @@ class ComicViewer(QWidget):
         </html>
         """)
 
-        self.image_label.setStyleSheet("""
-            QLabel {
-                border: 1px solid #595959;
-                border-radius: 8px;
-                background-color: #faeeae;
-                padding: 20px;
-            }
-        """)
+            self.image_label.setStyleSheet(_EMPTY_QSS)
 
-        self.progress_bar.setVisible(False)
-        self.status_label.setText("")
-        self.status_label.setVisible(False)
-        self.retry_button.setVisible(False)
+            self._hide_status_widgets()
 
-        # Delay content resize to let Qt finish layout
-        from PyQt6.QtCore import QTimer
-        QTimer.singleShot(0, self._resize_content_widget)
+            # Delay content resize to let Qt finish layout
+            QTimer.singleShot(0, self._resize_content_widget)
 
     def show_image_state(self):
         """Display normal image state (hide loading/error elements)."""
-        self.progress_bar.setVisible(False)
-        self.status_label.setText("")
-        self.status_label.setVisible(False)  # Hide status when empty
-        self.retry_button.setVisible(False)
+        with self._batch_updates():
+            self._hide_status_widgets()
         
-        # Reset image label styling for normal display
-        self.image_label.setStyleSheet("""
-            QLabel {
-                border: none;
-                border-radius: 8px;
-                background-color: transparent;
-            }
-        """)
+            # Reset image label styling for normal display
+            self.image_label.setStyleSheet(_IMAGE_SHOWN_QSS)
     
     def retry_loading(self):
         """Retry loading the current comic."""
@@ -789,23 +1147,53 @@ class ComicViewer(QWidget):
         self.current_comic_data = None
         self.current_pixmap = None
         
-        if self.image_loader:
-            self.image_loader.quit()
-            self.image_loader.wait()
-            self.image_loader = None
+        # Invalidate any pending image load
+        self._current_job_id += 1
+        self._loader_worker.latest_job_id = self._current_job_id
         
         self.title_label.setText("No comic selected")
         self.metadata_label.setText("")
         self.metadata_label.setVisible(False)  # Hide metadata when empty
         self.show_empty_state()
     
+    def cleanup(self):
+        """Stop the background image loading thread and prefetch decodes."""
+        self._loader_worker.latest_job_id = -1  # Skip anything still queued
+        self._stop_spinner()
+        self._prefetch_pool.clear()
+        # Decodes already running still report back; let them finish first
+        self._prefetch_pool.waitForDone(CLOSE_WAIT_MS)
+        if self._loader_thread.isRunning():
+            self._loader_thread.quit()
+            self._loader_thread.wait()
+    
     def resizeEvent(self, event):
         """Handle widget resize events to adjust image scaling."""
         super().resizeEvent(event)
 
         # Re-scale current image if available
         if self.current_pixmap and not self.current_pixmap.isNull():
+            if self._rescale_held:
+                return  # Re-scaled once by rescale_current()
+            self._interactive = True
+            self._idle_timer.start()
             self.display_image(self.current_pixmap)
         else:
             # No comic loaded (welcome/loading/error state) — re-size content widget
             self._resize_content_widget()
+
+    def _on_interaction_idle(self):
+        """Re-scale the current image smoothly once resizing has settled."""
+        self._interactive = False
+        if self.current_pixmap and not self.current_pixmap.isNull():
+            self.display_image(self.current_pixmap)
+
+    def hold_rescale(self):
+        """Stop re-scaling the image on resize until rescale_current() is called."""
+        self._rescale_held = True
+
+    def rescale_current(self):
+        """Re-scale the current image smoothly to the viewer's present size."""
+        self._rescale_held = False
+        self._idle_timer.stop()
+        self._on_interaction_idle()
@@ -2,30 +2,472 @@
 Main window UI component for the Comic Strip Browser application.
 
 This module contains the MainWindow class which serves as the primary application
-window and UI coordinator, providing the basic window structure with menu bar,
-toolbar, status bar, and cross-platform compatibility.
+window and UI coordinator, providing the basic window structure with status bar
+and cross-platform compatibility.
 """
 
 import sys
 import os
 import subprocess
 import platform
+import random
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import date, timedelta
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Optional
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QStatusBar, QApplication, QPushButton,
-    QSplitter, QFrame
+    QSplitter, QCalendarWidget, QDialog
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QUrl
-from PyQt6.QtGui import QIcon, QFont, QDesktopServices
+from PyQt6.QtCore import (
+    Qt, QSize, pyqtSignal, pyqtSlot, QUrl, QTimer, QObject, QRunnable, QThreadPool
+)
+from PyQt6.QtGui import QIcon, QFont, QDesktopServices, QShortcut, QKeySequence
 
 from ui.comic_selector import ComicSelector
 from ui.comic_viewer import ComicViewer
 from ui.calendar_widget import CalendarWidget
 from ui.comic_controller import ComicController
 from ui.about_dialog import AboutDialog
-from models.data_models import get_comic_definition
+from models.data_models import ComicData, get_comic_definition
 from version import __version__
 
+# Platform check, evaluated once at import
+_IS_WIN32 = sys.platform == "win32"
+
+# Application icon, resolved once relative to the project root
+_ICON_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "initial_transparent_alpha.png"
+)
+_ICON_EXISTS = os.path.exists(_ICON_PATH)
+
+# The icon itself, decoded by the first window (a QIcon needs a QApplication)
+_APP_ICON = None
+
+# Window-wide stylesheet, parsed by Qt from the same string object every time
+_WINDOW_QSS = """
+    QMainWindow {
+        background-color: #e8e8e8;
+    }
+    QFrame {
+        background-color: transparent;
+        border: 1px solid #cccccc;
+    }
+    QToolBar {
+        border: none;
+        spacing: 3px;
+    }
+    QStatusBar {
+        background-color: #f0f0f0;
+        border-top: 1px solid #d0d0d0;
+        color: #000000;
+        min-height: 25px;
+        padding: 2px;
+    }
+"""
+
+# Recovery actions offered for each error type, after "Retry"
+_RECOVERY_BY_TYPE = {
+    "network": ("Try Yesterday", "Try Different Date"),
+    "unavailable": ("Try Yesterday", "Try Different Date", "Select Different Comic"),
+    "parsing": ("Try Different Date", "Select Different Comic"),
+}
+
+# Extra recovery actions triggered by keywords in the error handler's
+# suggestions, in the order the buttons are added
+_RECOVERY_KEYWORDS = {
+    "previous day": "Try Yesterday",
+    "yesterday": "Try Yesterday",
+    "different date": "Try Different Date",
+    "different comic": "Select Different Comic",
+    "another comic": "Select Different Comic",
+}
+
+# Appended to the comic selector's stylesheet to draw attention to it
+_HIGHLIGHT_QSS = """
+    QWidget {
+        border: 2px solid #007bff;
+        border-radius: 4px;
+    }
+"""
+
+# Abbreviated (AP style) month names for the status bar, indexed by month - 1
+_MONTH_ABBR = (
+    "Jan.", "Feb.", "March", "April", "May", "June",
+    "July", "Aug.", "Sept.", "Oct.", "Nov.", "Dec."
+)
+
+def _get_app_icon() -> QIcon:
+    """Return the application icon, loading it on first use."""
+    global _APP_ICON
+    if _APP_ICON is None:
+        _APP_ICON = QIcon(_ICON_PATH) if _ICON_EXISTS else QIcon()
+    return _APP_ICON
+
+
+@lru_cache(maxsize=64)
+def _fmt_long_date(d: date) -> str:
+    """Format a date for status messages, e.g. "January 05, 2024"."""
+    return d.strftime("%B %d, %Y")
+
+
+def _fmt_short_date(d: date) -> str:
+    """Format a date for progress messages, e.g. "Jan. 5" (no locale lookup)."""
+    return f"{_MONTH_ABBR[d.month - 1]} {d.day}"
+
+
+# Frequent status bar messages
+_MSG_READY = "Ready"
+_MSG_NO_COMIC = "Please select a comic first"
+_MSG_REACHED_TODAY = "Reached today's date"
+_MSG_REACHED_START = "Reached comic's start date"
+
+# Quiet period after the last splitter move before the comic is re-scaled
+SPLITTER_SETTLE_MS = 100
+
+# Concurrent previous/next searches allowed; stale ones exit at their next step
+SEARCH_POOL_SIZE = 5
+
+# Failed fetches after which a previous/next search gives up
+SEARCH_MAX_ATTEMPTS = 7
+
+# Dates a search fetches in parallel, once the nearest one has missed on its
+# own, before deciding which one loaded first; also the size of the I/O pool
+SEARCH_WINDOW = 8
+
+# Minimum interval between a search's progress signals (status bar updates)
+SEARCH_PROGRESS_INTERVAL_NS = 50_000_000
+
+# Quiet period after the last arrow-key repeat before navigating
+NAV_DEBOUNCE_MS = 150
+
+# Distances (in days, on each side) of the comics fetched into the cache
+# ahead of time around a displayed one: the next few days and a week away
+PREFETCH_OFFSETS = (1, 2, 3, 7)
+
+# Threads fetching adjacent comics; kept small to leave bandwidth for the view
+PREFETCH_POOL_SIZE = 2
+
+# Longest wait (ms) on closing for running searches and prefetches to finish
+CLOSE_WAIT_MS = 3000
+
+# Days searched forward from a random date; random dates are picked at least
+# this far before today so the search never runs into today
+RANDOM_SEARCH_DAYS = 14
+
+
+class ComicSearchSignals(QObject):
+    """Signals for previous/next searches running in the search pool."""
+    progress = pyqtSignal(int, object)  # search_id, date being fetched
+    found = pyqtSignal(int, object, object)  # search_id, date, ComicData
+    not_found = pyqtSignal(int, str)  # search_id, status message
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Id of the newest search; older tasks stop at their next step
+        self.latest_search_id = 0
+
+
+def _earliest_hit(results: dict, count: int) -> Optional[int]:
+    """
+    Decide which of a window of fetches wins, as if tried in order.
+    
+    Args:
+        results: ComicData (or None for a failure) by window index, for the
+            fetches that have finished
+        count: Size of the window
+        
+    Returns:
+        Index of the first comic that loaded once every earlier fetch has
+        failed, -1 if all failed, or None while still undecided
+    """
+    for i in range(count):
+        if i not in results:
+            return None
+        if results[i] is not None:
+            return i
+    return -1
+
+
+def _comic_or_none(future: Future) -> Optional[ComicData]:
+    """
+    Wait for a comic fetch started by MainWindow._fetch_shared.
+    
+    Args:
+        future: Future of the fetch (cache hit or download)
+        
+    Returns:
+        The ComicData, or None if there is no comic or it could not be fetched
+    """
+    try:
+        return future.result()
+    except Exception:
+        # ComicNotAvailableError (nothing published that day), a network,
+        # parsing or other error, or a cancelled fetch: all count as a miss
+        return None
+
+
+class ComicSearchWorker(QRunnable):
+    """
+    Walk day by day from a date to the nearest one with a comic.
+    
+    Dates the comic definition rules out (skip ranges, publishing
+    frequency) are passed over without a request. The nearest remaining
+    date is fetched on its own; if it misses, the following ones are
+    fetched SEARCH_WINDOW at a time in parallel, and the earliest one (in
+    search order) that loads wins, as if they had been tried one by one.
+    The search gives up after SEARCH_MAX_ATTEMPTS failed fetches.
+    """
+    
+    def __init__(self, comic_service, comic_name: str, start_date: date,
+                 step: int, search_id: int, signals: ComicSearchSignals,
+                 fetch: Callable[[str, date], Future], release: Callable[[Future], None],
+                 scope: Optional[str] = None):
+        """
+        Initialize the search.
+        
+        Args:
+            comic_service: Service used to fetch comics
+            comic_name: Name of the comic strip
+            start_date: Date to search from (not itself tried)
+            step: -1 to search backwards, 1 to search forwards
+            search_id: Id of this search, compared against signals.latest_search_id
+            signals: Signal holder living on the GUI thread
+            fetch: Starts fetching a comic (or joins a fetch of it already
+                under way), returning its Future
+            release: Gives up on a Future from fetch, cancelling the fetch if
+                it has not started and nobody else waits for it
+            scope: How the searched range is described when nothing is
+                found, e.g. "next 14 days" (the default for the direction)
+        """
+        super().__init__()
+        self.comic_service = comic_service
+        self.comic_name = comic_name
+        self.start_date = start_date
+        self.step = step
+        self.search_id = search_id
+        self.signals = signals
+        self.fetch = fetch
+        self.release = release
+        self.scope = scope
+        self._last_progress_ns = None
+    
+    def _is_stale(self) -> bool:
+        """Check whether a newer search has replaced this one."""
+        return self.search_id != self.signals.latest_search_id
+    
+    def _report_progress(self, search_date: date):
+        """Emit progress for a date, at most once per SEARCH_PROGRESS_INTERVAL_NS."""
+        now = time.monotonic_ns()
+        if (self._last_progress_ns is None
+                or now - self._last_progress_ns >= SEARCH_PROGRESS_INTERVAL_NS):
+            self._last_progress_ns = now
+            self.signals.progress.emit(self.search_id, search_date)
+    
+    def _candidates(self, comic_def, out_of_range):
+        """
+        Yield the dates that should have a comic, in search order.
+        
+        Args:
+            comic_def: Definition of the comic, or None
+            out_of_range: Predicate telling whether a date is past the limit
+        """
+        # Loop invariants: parse the skip ranges and resolve lookups once
+        step = timedelta(days=self.step)
+        backwards = self.step < 0
+        skip_ranges = [
+            (date.fromisoformat(start_str), date.fromisoformat(end_str))
+            for start_str, end_str in (comic_def.skip_ranges if comic_def else None) or ()
+        ]
+        is_available = comic_def.is_available if comic_def else None
+        weekdays = comic_def.publish_weekdays if comic_def else None
+        
+        search_date = self.start_date
+        while True:
+            search_date += step
+            # Go straight to the next publishing day of a fixed-weekday comic
+            if weekdays:
+                while search_date.weekday() not in weekdays:
+                    search_date += step
+            if out_of_range(search_date):
+                return
+            
+            # Jump over a skip range to the day just outside it
+            for range_start, range_end in skip_ranges:
+                if range_start <= search_date <= range_end:
+                    search_date = (range_start if backwards else range_end) + step
+                    if out_of_range(search_date):
+                        return
+                    break
+            
+            # Skip known unavailable dates
+            if is_available and not is_available(search_date):
+                continue
+            
+            yield search_date
+    
+    def _fetch_window(self, window: list, cached: dict) -> Optional[tuple]:
+        """
+        Fetch the uncached dates of a window in parallel.
+        
+        Args:
+            window: Candidate dates in search order
+            cached: Comics already in the cache, by date
+            
+        Returns:
+            (date, ComicData) for the earliest date that loaded, or None
+        """
+        if self.comic_service.is_degraded():
+            # Offline or rate-limited: only what is cached can be found
+            results = {i: cached.get(d) for i, d in enumerate(window)}
+        else:
+            results = {i: cached[d] for i, d in enumerate(window) if d in cached}
+        pending = {}
+        hit = None
+        try:
+            for i, search_date in enumerate(window):
+                if i not in results:
+                    pending[self.fetch(self.comic_name, search_date)] = i
+            
+            hit = _earliest_hit(results, len(window))
+            if hit is None:
+                for future in as_completed(pending):
+                    results[pending[future]] = _comic_or_none(future)
+                    hit = _earliest_hit(results, len(window))
+                    if hit is not None or self._is_stale():
+                        break
+                    # Report the earliest date still being waited on
+                    waiting = next(i for i in range(len(window)) if i not in results)
+                    self._report_progress(window[waiting])
+        except RuntimeError:
+            return None  # I/O pool shut down: the window is closing
+        finally:
+            # Fetches no longer needed are cancelled unless they have started
+            # (those finish and cache their comic) or are shared with others
+            for future in pending:
+                self.release(future)
+        
+        if hit is not None and hit >= 0:
+            return window[hit], results[hit]
+        return None
+    
+    def run(self):
+        """Try candidate dates in order until one loads or the search ends."""
+        comic_def = get_comic_definition(self.comic_name)
+        comic_display_name = comic_def.display_name if comic_def else self.comic_name
+        cache_manager = self.comic_service.cache_manager
+        
+        # Searches stop at the comic's start date going back, today going forward
+        if self.step < 0:
+            limit = comic_def.earliest_date if comic_def else date(1900, 1, 1)
+            limit_message = _MSG_REACHED_START
+            scope = self.scope or "previous 14 days"
+        else:
+            limit = date.today()
+            limit_message = _MSG_REACHED_TODAY
+            scope = self.scope or "next 14 days"
+        
+        if self.step < 0:
+            def out_of_range(d: date) -> bool:
+                return d < limit
+        else:
+            def out_of_range(d: date) -> bool:
+                return d > limit
+        
+        candidates = self._candidates(comic_def, out_of_range)
+        days_attempted = 0
+        # The nearest date usually has a comic, so it is fetched on its own;
+        # only after it misses are the following dates fetched in parallel
+        window_size = 1
+        
+        while days_attempted < SEARCH_MAX_ATTEMPTS:
+            if self._is_stale():
+                return
+            
+            window = list(islice(candidates, min(window_size, SEARCH_MAX_ATTEMPTS - days_attempted)))
+            if not window:
+                self.signals.not_found.emit(self.search_id, limit_message)
+                return
+            
+            # The nearest dates are often cached already (prefetched)
+            cached = cache_manager.get_cached_comics_batch(self.comic_name, window)
+            if window[0] in cached:
+                self.signals.found.emit(self.search_id, window[0], cached[window[0]])
+                return
+            
+            # We found dates that SHOULD have a comic. Try to fetch them.
+            self._report_progress(window[0])
+            
+            hit = self._fetch_window(window, cached)
+            if self._is_stale():
+                return
+            if hit:
+                self.signals.found.emit(self.search_id, *hit)
+                return
+            days_attempted += len(window)
+            window_size = SEARCH_WINDOW
+        
+        self.signals.not_found.emit(
+            self.search_id, f"No {comic_display_name} found in {scope}"
+        )
+
+
+class ComicPrefetchSignals(QObject):
+    """Signals for adjacent-day prefetches running in the prefetch pool."""
+    finished = pyqtSignal(int, str, object)  # generation, comic_name, date
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Current prefetch generation; tasks from older ones do nothing
+        self.generation = 0
+
+
+class ComicPrefetchTask(QRunnable):
+    """Fetch one comic into the cache so navigating to it is instant."""
+    
+    def __init__(self, fetch: Callable[[str, date], Future],
+                 release: Callable[[Future], None], comic_name: str,
+                 comic_date: date, generation: int, signals: ComicPrefetchSignals):
+        """
+        Initialize the prefetch.
+        
+        Args:
+            fetch: Starts fetching (and caching) a comic, or joins a fetch of
+                it already under way, returning its Future
+            release: Gives up on a Future from fetch
+            comic_name: Name of the comic strip
+            comic_date: Date of the comic to fetch
+            generation: Prefetch generation this task belongs to
+            signals: Signal holder living on the GUI thread
+        """
+        super().__init__()
+        self.fetch = fetch
+        self.release = release
+        self.comic_name = comic_name
+        self.comic_date = comic_date
+        self.generation = generation
+        self.signals = signals
+    
+    def run(self):
+        """Fetch the comic unless its generation has been superseded."""
+        try:
+            if self.generation == self.signals.generation:
+                # get_comic returns cached comics as is and caches fetched ones;
+                # a failure is left for the user to see on navigation
+                future = self.fetch(self.comic_name, self.comic_date)
+                _comic_or_none(future)
+                self.release(future)
+        except RuntimeError:
+            pass  # I/O pool shut down: the window is closing
+        # Cancelled prefetches (older generation) have nobody to report to
+        if self.generation == self.signals.generation:
+            self.signals.finished.emit(self.generation, self.comic_name, self.comic_date)
+
 
 class MainWindow(QMainWindow):
     """
@@ -46,6 +488,76 @@ class MainWindow(QMainWindow):
         """Initialize the main window with basic structure."""
         super().__init__()
         self.comic_controller = None
+        self.status_bar = None
+
+        # Name and definition of the selected comic, kept in sync by on_comic_selected
+        self._current_comic = None
+        self._current_comic_def = None
+        # Selected date, kept in sync by on_date_changed and _navigate_to_date
+        self._current_date = date.today()
+
+        # Auto-advance search state (skip forward over days without a comic)
+        self._auto_advancing = False
+        self._auto_advance_start = None
+        self._auto_advance_comic = None
+
+        # Single-shot timer ending the comic selector highlight (error recovery)
+        self._selector_qss = ""
+        self._highlight_timer = QTimer(self)
+        self._highlight_timer.setSingleShot(True)
+        self._highlight_timer.timeout.connect(self._unhighlight_comic_selector)
+
+        # Date selection dialog for error recovery, built on first use
+        self._date_dialog = None
+        self._date_calendar = None
+
+        # Coalescing timer for update_status, one frame long
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(16)
+        self._status_timer.timeout.connect(self._flush_status)
+
+        # Previous/next searches, run off the GUI thread; results from a
+        # search that has since been replaced are dropped by id
+        self._search_id = 0
+        self._search_pool = QThreadPool(self)
+        self._search_pool.setMaxThreadCount(SEARCH_POOL_SIZE)
+        self._search_signals = ComicSearchSignals(self)
+        self._search_signals.progress.connect(self._on_search_progress)
+        self._search_signals.found.connect(self._on_search_found)
+        self._search_signals.not_found.connect(self._on_search_not_found)
+
+        # One long-lived pool runs every comic fetch (search windows and
+        # prefetches), so its threads stay warm between clicks
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=SEARCH_WINDOW, thread_name_prefix="comic-io"
+        )
+
+        # Fetches under way, by (comic, date), shared by searches and
+        # prefetches so the same comic is never downloaded twice at once; each
+        # fetch counts its waiters so one nobody waits for can be cancelled
+        self._inflight: dict[tuple[str, date], Future] = {}
+        self._inflight_waiters: dict[Future, int] = {}
+        # Reentrant: cancelling a fetch runs _forget_inflight on the same thread
+        self._inflight_lock = threading.RLock()
+
+        # Arrow-key steps are summed while the key repeats and searched for
+        # once the repeats stop
+        self._pending_nav_offset = 0
+        self._nav_timer = QTimer(self)
+        self._nav_timer.setSingleShot(True)
+        self._nav_timer.setInterval(NAV_DEBOUNCE_MS)
+        self._nav_timer.timeout.connect(self._dispatch_nav)
+
+        # Adjacent-day prefetches, tracked by (comic, date) so repeated
+        # displays don't queue the same fetch twice
+        self._prefetch_in_flight = set()
+        self._prefetch_pool = QThreadPool(self)
+        self._prefetch_pool.setMaxThreadCount(PREFETCH_POOL_SIZE)
+        self._prefetch_signals = ComicPrefetchSignals(self)
+        self._prefetch_signals.finished.connect(self._on_prefetch_finished)
+
         self.initialize_ui()
         self.setup_cross_platform_compatibility()
         self.setup_controller_integration()
@@ -63,12 +575,7 @@ class MainWindow(QMainWindow):
  
         
         # Set application icon
-        import os
-        icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "initial_transparent_alpha.png")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
-        else:
-            self.setWindowIcon(QIcon())
+        self.setWindowIcon(_get_app_icon())
         
         # Create central widget and main layout
         central_widget = QWidget()
@@ -92,15 +599,17 @@ class MainWindow(QMainWindow):
         self.comic_selector.setMinimumWidth(280)
         self.comic_selector.setMaximumWidth(350)
         
-        # Connect comic selector signals
+        # Connect comic selector signals; the window signal is forwarded
+        # signal-to-signal so it costs no Python dispatch
         self.comic_selector.comic_selected.connect(self.on_comic_selected)
+        self.comic_selector.comic_selected.connect(self.comic_selected)
         
         # Center panel - Comic viewer
         self.comic_viewer = ComicViewer()
         
         # Connect comic viewer signals
-        self.comic_viewer.loading_started.connect(lambda: self.update_status("Loading comic..."))
-        self.comic_viewer.loading_finished.connect(lambda: self.update_status("Ready", 2000))
+        self.comic_viewer.loading_started.connect(self._on_loading_started)
+        self.comic_viewer.loading_finished.connect(self._on_loading_finished)
         self.comic_viewer.comic_displayed.connect(self.on_comic_displayed)
         
         # Right panel - Calendar navigation widget
@@ -110,6 +619,7 @@ class MainWindow(QMainWindow):
         
         # Connect calendar widget signals
         self.calendar_widget.date_selected.connect(self.on_date_changed)
+        self.calendar_widget.date_selected.connect(self.date_changed)
         self.calendar_widget.month_changed.connect(self.on_month_changed)
         
         # Add panels to splitter
@@ -120,11 +630,44 @@ class MainWindow(QMainWindow):
         # Set initial splitter proportions
         self.main_splitter.setSizes([280, 700, 280])
 
+        # Re-scale the comic once when a splitter drag settles, not per move
+        self._splitter_timer = QTimer(self)
+        self._splitter_timer.setSingleShot(True)
+        self._splitter_timer.setInterval(SPLITTER_SETTLE_MS)
+        self._splitter_timer.timeout.connect(self._on_splitter_settled)
+        self.main_splitter.splitterMoved.connect(self._on_splitter_moved)
+
         # Manually trigger initial comic selection since the signal was likely emitted during ComicSelector init
+        if self.comic_selector.get_selected_comic():
+            QTimer.singleShot(0, self._select_initial_comic)
+
+    @pyqtSlot(int, int)
+    def _on_splitter_moved(self, pos: int, index: int):
+        """Hold the comic's scaling while a splitter handle is being dragged."""
+        self.comic_viewer.hold_rescale()
+        self._splitter_timer.start()
+
+    @pyqtSlot()
+    def _on_splitter_settled(self):
+        """Re-scale the comic to the size the splitter drag left it at."""
+        self.comic_viewer.rescale_current()
+
+    @pyqtSlot()
+    def _select_initial_comic(self):
+        """Load the comic that was preselected while the selector was built."""
         initial_comic = self.comic_selector.get_selected_comic()
         if initial_comic:
-            from PyQt6.QtCore import QTimer
-            QTimer.singleShot(0, lambda: self.on_comic_selected(initial_comic))
+            self.on_comic_selected(initial_comic)
+
+    @pyqtSlot()
+    def _on_loading_started(self):
+        """Show the loading message when the viewer starts loading."""
+        self.update_status("Loading comic...")
+
+    @pyqtSlot()
+    def _on_loading_finished(self):
+        """Show a short-lived ready message when the viewer finishes loading."""
+        self.update_status(_MSG_READY, 2000)
     
 
     
@@ -145,15 +688,7 @@ class MainWindow(QMainWindow):
         status_font.setFamilies(["Noto Sans", "Segoe UI", "Arial", "sans-serif"])
         self.status_bar.setFont(status_font)
 
-        # Set status bar with explicit styling
-        self.status_bar.setStyleSheet("""
-            QStatusBar {
-                background-color: #f0f0f0;
-                border-top: 1px solid #d0d0d0;
-                color: #000000;
-                padding: 2px;
-            }
-        """)
+        # Styled by the QStatusBar rule in _WINDOW_QSS
 
         # Cache button — open cache folder
         self.cache_btn = QPushButton("Cache")
@@ -202,41 +737,23 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
 
         # Show ready message with version after a short delay
-        from PyQt6.QtCore import QTimer
-        QTimer.singleShot(100, lambda: self.status_bar.showMessage(f"Ready - v{__version__}", 0))
+        QTimer.singleShot(100, self._show_ready_message)
+
+    @pyqtSlot()
+    def _show_ready_message(self):
+        """Show the permanent startup message with the application version."""
+        self.update_status(f"Ready - v{__version__}", 0)
     
     def setup_cross_platform_compatibility(self):
         """Configure settings for cross-platform compatibility."""
         # Set consistent style across platforms
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #e8e8e8;
-            }
-            QFrame {
-                background-color: transparent;
-                border: 1px solid #cccccc;
-            }
-            QToolBar {
-                border: none;
-                spacing: 3px;
-            }
-            QStatusBar {
-                background-color: #f0f0f0;
-                border-top: 1px solid #d0d0d0;
-                color: #333333;
-                min-height: 25px;
-                padding: 2px;
-            }
-        """)
+        self.setStyleSheet(_WINDOW_QSS)
         
-        # Platform-specific adjustments
-        if sys.platform == "win32":
-            # Windows-specific settings
+        # Windows-specific adjustments; default settings work well on Linux
+        if _IS_WIN32:
             self.setWindowFlags(self.windowFlags() | Qt.WindowType.WindowMinMaxButtonsHint)
-        elif sys.platform == "linux":
-            # Linux-specific settings
-            pass  # Default settings work well on Linux
     
+    @pyqtSlot(str)
     def on_comic_selected(self, comic_name: str):
         """
         Handle comic selection events.
@@ -244,31 +761,30 @@ class MainWindow(QMainWindow):
         Args:
             comic_name: Name of the selected comic strip
         """
-        from datetime import date, timedelta
-        
         # Guard against invalid comic names
         if not comic_name or not isinstance(comic_name, str) or len(comic_name) == 0:
             self.update_status("Invalid comic selection", 3000)
             return
         
-        self.status_bar.showMessage(f"Selected comic: {comic_name}", 3000)
-        
-        current_date = self.calendar_widget.get_selected_date()
-        comic_def = get_comic_definition(comic_name)
-        today = date.today()
-        
-        # Determine target date: prefer today, but respect comic's date range
-        if not current_date:
-            # No date selected - start with today (or yesterday if today not available)
-            target_date = today
+        self._cancel_search()
+        if comic_name != self._current_comic:
+            self._cancel_prefetch()
+        self._current_comic = comic_name
+        # Resolved once here; the navigation handlers read it on every click
+        self._current_comic_def = get_comic_definition(comic_name)
+        self.update_status(f"Selected comic: {comic_name}", 3000)
+        
+        current_date = self._current_date
+        comic_def = self._current_comic_def
+        
+        # Determine target date: keep the current date (today until one is
+        # picked), but respect comic's date range
+        if comic_def and comic_def.earliest_date and current_date < comic_def.earliest_date:
+            # Current date is before comic start - use comic's start date
+            target_date = comic_def.earliest_date
         else:
-            # Date already selected - only change if it's before comic's start date
-            if comic_def and comic_def.earliest_date and current_date < comic_def.earliest_date:
-                # Current date is before comic start - use comic's start date
-                target_date = comic_def.earliest_date
-            else:
-                # Current date is valid for this comic - keep it
-                target_date = current_date
+            # Current date is valid for this comic - keep it
+            target_date = current_date
         
         # Navigate to target date and load comic (don't emit signal to prevent double-load)
         self.calendar_widget.set_comic_info(comic_name)
@@ -291,11 +807,11 @@ class MainWindow(QMainWindow):
                 if comic_def.earliest_date:
                     target_date = comic_def.earliest_date
         
-        self.calendar_widget.navigate_to_date(target_date, emit_signal=False)
-        self.comic_controller.load_comic(comic_name, target_date)
-
-        self.comic_selected.emit(comic_name)
+        with self._batch_updates():
+            self._navigate_to_date(target_date, emit_signal=False)
+            self.comic_controller.load_comic(comic_name, target_date)
     
+    @pyqtSlot(object)
     def on_date_changed(self, date):
         """
         Handle calendar date selection events.
@@ -303,10 +819,12 @@ class MainWindow(QMainWindow):
         Args:
             date: Selected date object
         """
-        self.status_bar.showMessage(f"Selected date: {date}", 3000)
+        self._cancel_search()
+        self._current_date = date
+        self.update_status(f"Selected date: {date}", 3000)
         
         # Load comic for the selected date
-        current_comic = self.comic_selector.get_selected_comic()
+        current_comic = self._current_comic
         
         # Guard against invalid comic names
         if not current_comic or not isinstance(current_comic, str) or len(current_comic) == 0:
@@ -314,15 +832,14 @@ class MainWindow(QMainWindow):
             return
         
         # Additional validation - check if comic exists in definitions
-        from models.data_models import get_comic_definition
         if not get_comic_definition(current_comic):
             self.update_status(f"Invalid comic selection: {current_comic}", 3000)
             return
         
         self.calendar_widget.set_comic_info(current_comic)
         self.comic_controller.load_comic(current_comic, date)
-        self.date_changed.emit(date)
     
+    @pyqtSlot(int, int)
     def on_month_changed(self, month: int, year: int):
         """
         Handle calendar month/year change events.
@@ -331,13 +848,10 @@ class MainWindow(QMainWindow):
             month: New month (1-12)
             year: New year
         """
-        month_names = [
-            "Jan.", "Feb.", "March", "April", "May", "June",
-            "July", "Aug.", "Sept.", "Oct.", "Nov.", "Dec."
-        ]
-        month_name = month_names[month - 1]
-        self.status_bar.showMessage(f"Viewing {month_name} {year}", 2000)
+        month_name = _MONTH_ABBR[month - 1]
+        self.update_status(f"Viewing {month_name} {year}", 2000)
     
+    @pyqtSlot(str)
     def on_comic_displayed(self, comic_name: str):
         """
         Handle comic displayed event and show start date info.
@@ -347,14 +861,114 @@ class MainWindow(QMainWindow):
         """
         comic_def = get_comic_definition(comic_name)
         if comic_def and comic_def.earliest_date:
-            start_date_str = comic_def.earliest_date.strftime("%B %d, %Y")
+            start_date_str = _fmt_long_date(comic_def.earliest_date)
             message = f"{comic_def.display_name} starts online on {start_date_str}"
             self.update_status(message, 0)  # Permanent message (timeout = 0)
         else:
             # Fallback if no start date found
             self.update_status(f"Displaying {comic_name}", 0)
+
+        self._prefetch_neighbour_images(comic_name)
+        current = self.comic_viewer.get_current_comic_data()
+        if current:
+            self._prefetch_adjacent(comic_name, current.date)
+
+    def _prefetch_neighbour_images(self, comic_name: str):
+        """
+        Decode the cached previous/next comics in the background.
+
+        Args:
+            comic_name: Name of the displayed comic
+        """
+        comic_data = self.comic_viewer.get_current_comic_data()
+        comic_def = get_comic_definition(comic_name)
+        if not comic_data or not comic_def or not self.comic_controller:
+            return
+
+        cache_manager = self.comic_controller.comic_service.cache_manager
+        for step in (-1, 1):
+            # Nearest date on each side that should have a comic
+            neighbour = comic_data.date
+            for _ in range(7):
+                neighbour += timedelta(days=step)
+                if comic_def.is_available(neighbour):
+                    cached = cache_manager.get_cached_comic(comic_name, neighbour)
+                    if cached:
+                        self.comic_viewer.prefetch(cached.cached_image_path)
+                    break
+    
+
+    
+    def _prefetch_adjacent(self, comic_name: str, center_date: date):
+        """
+        Fetch the comics around a date into the cache in the background.
+        
+        Args:
+            comic_name: Name of the comic strip
+            center_date: Date of the displayed comic
+        """
+        comic_def = get_comic_definition(comic_name)
+        if not comic_def or not self.comic_controller:
+            return
+        if self.comic_controller.comic_service.is_degraded():
+            return  # Don't spend requests on guesses while offline or rate-limited
+        
+        earliest_date = comic_def.earliest_date or date(1900, 1, 1)
+        today = date.today()
+        generation = self._prefetch_signals.generation
+        for offset in PREFETCH_OFFSETS:
+            for step in (-offset, offset):
+                prefetch_date = center_date + timedelta(days=step)
+                key = (comic_name, prefetch_date)
+                if (not earliest_date <= prefetch_date <= today
+                        or key in self._prefetch_in_flight
+                        or not comic_def.is_available(prefetch_date)):
+                    continue
+                self._prefetch_in_flight.add(key)
+                self._prefetch_pool.start(ComicPrefetchTask(
+                    self._fetch_shared, self._release_fetch, comic_name, prefetch_date, generation,
+                    self._prefetch_signals
+                ))
     
+    def _cancel_prefetch(self):
+        """Drop queued prefetches and ignore the ones still running."""
+        self._prefetch_signals.generation += 1
+        self._prefetch_pool.clear()
+        self._prefetch_in_flight.clear()
+    
+    @pyqtSlot(int, str, object)
+    def _on_prefetch_finished(self, generation: int, comic_name: str, comic_date: date):
+        """Forget a finished prefetch so the date can be fetched again later."""
+        if generation == self._prefetch_signals.generation:
+            self._prefetch_in_flight.discard((comic_name, comic_date))
+    
+    def _navigate_to_date(self, target_date: date, emit_signal: bool = True):
+        """
+        Move the calendar to a date and remember it as the current date.
+        
+        Args:
+            target_date: The date to navigate to
+            emit_signal: Whether the calendar should emit date_selected
+        """
+        self._current_date = target_date
+        self.calendar_widget.navigate_to_date(target_date, emit_signal)
+    
+    @contextmanager
+    def _batch_updates(self):
+        """
+        Suspend repaints while the calendar and viewer are updated, then paint once.
 
+        Nested use is a no-op so that only the outermost block repaints.
+        """
+        if not self.updatesEnabled():
+            yield
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
     
     def update_status(self, message: str, timeout: int = 0):
         """
@@ -364,8 +978,18 @@ class MainWindow(QMainWindow):
             message: Message to display
             timeout: Timeout in milliseconds (0 for permanent)
         """
-        if hasattr(self, 'status_bar') and self.status_bar:
-            self.status_bar.showMessage(message, timeout)
+        # Bursts of updates within one frame collapse into a single repaint
+        # showing the latest message
+        self._pending_status = (message, timeout)
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    @pyqtSlot()
+    def _flush_status(self):
+        """Show the most recent status message passed to update_status."""
+        if self._pending_status is not None and self.status_bar is not None:
+            self.status_bar.showMessage(*self._pending_status)
+        self._pending_status = None
     
     def get_comic_selector(self) -> ComicSelector:
         """Get the comic selector widget."""
@@ -381,62 +1005,59 @@ class MainWindow(QMainWindow):
     
     def setup_controller_integration(self):
         """Set up the comic controller and integrate it with UI components."""
-        # Create the comic controller
+        # Create the comic controller; its loads share fetches under way
+        # with searches and prefetches
         self.comic_controller = ComicController()
+        self.comic_controller.shared_load = self._load_shared
         
         # Connect UI components to controller
         # NOTE: Don't connect these to controller - we handle them in on_comic_selected and on_date_changed
         # self.comic_selector.comic_selected.connect(self.comic_controller.select_comic)
         # self.calendar_widget.date_selected.connect(self.comic_controller.select_date)
         
-        # Connect controller signals to UI components
-        self.comic_controller.comic_loaded.connect(self.comic_viewer.display_comic)
-        self.comic_controller.comic_loading_started.connect(self.on_comic_loading_started)
-        self.comic_controller.comic_loading_finished.connect(self.on_comic_loading_finished)
-        self.comic_controller.loading_error.connect(self.on_loading_error)
+        # Connect controller signals to UI components. Queued, so the UI slots
+        # always run from the GUI event loop, whichever thread emits.
+        queued = Qt.ConnectionType.QueuedConnection
+        self.comic_controller.comic_loaded.connect(self.comic_viewer.display_comic, queued)
+        self.comic_controller.comic_loading_started.connect(self.on_comic_loading_started, queued)
+        self.comic_controller.comic_loading_finished.connect(self.on_comic_loading_finished, queued)
+        self.comic_controller.loading_error.connect(self.on_loading_error, queued)
         
-        # Add debounce tracking
-        self._last_error_time = 0
-        self._last_error_message = ""
+        # Recovery buttons in the viewer's error state report back here
+        self.comic_viewer.set_error_recovery_callback(self._handle_error_recovery)
         
+        # Add debounce tracking (monotonic clock; message compared by hash)
+        self._last_error_time = float("-inf")
+        self._last_error_hash = None
 
-        
-        # Connect navigation buttons in the comic viewer
-        if hasattr(self.comic_viewer, 'first_button'):
-            self.comic_viewer.first_button.clicked.connect(self.go_to_first)
-        
-        if hasattr(self.comic_viewer, 'prev_button'):
-            self.comic_viewer.prev_button.clicked.connect(self.go_to_previous_day)
-        
-        if hasattr(self.comic_viewer, 'next_button'):
-            self.comic_viewer.next_button.clicked.connect(self.go_to_next_day)
-        
-        if hasattr(self.comic_viewer, 'today_button'):
-            self.comic_viewer.today_button.clicked.connect(self.go_to_today)
-        
-        if hasattr(self.comic_viewer, 'random_button'):
-            self.comic_viewer.random_button.clicked.connect(self.go_to_random)
-        
-        # Add keyboard shortcuts for navigation
-        from PyQt6.QtGui import QShortcut, QKeySequence
-        from PyQt6.QtCore import Qt
-        
-        # Left arrow = Previous
-        self.shortcut_prev = QShortcut(QKeySequence(Qt.Key.Key_Left), self)
-        self.shortcut_prev.activated.connect(self.go_to_previous_day)
-        
-        # Right arrow = Next
-        self.shortcut_next = QShortcut(QKeySequence(Qt.Key.Key_Right), self)
-        self.shortcut_next.activated.connect(self.go_to_next_day)
-        
-        # Home = First
-        self.shortcut_first = QShortcut(QKeySequence(Qt.Key.Key_Home), self)
-        self.shortcut_first.activated.connect(self.go_to_first)
-        
-        # End = Today
-        self.shortcut_today = QShortcut(QKeySequence(Qt.Key.Key_End), self)
-        self.shortcut_today.activated.connect(self.go_to_today)
+        # Navigation buttons and shortcuts are wired once the event loop
+        # runs, so they don't delay the window's first paint
+        QTimer.singleShot(0, self._setup_navigation)
+    
+    @pyqtSlot()
+    def _setup_navigation(self):
+        """Connect the viewer's navigation buttons and keyboard shortcuts."""
+        # Connect navigation buttons in the comic viewer (always built by setup_ui)
+        viewer = self.comic_viewer
+        viewer.first_button.clicked.connect(self.go_to_first)
+        viewer.prev_button.clicked.connect(self.go_to_previous_day)
+        viewer.next_button.clicked.connect(self.go_to_next_day)
+        viewer.today_button.clicked.connect(self.go_to_today)
+        viewer.random_button.clicked.connect(self.go_to_random)
+        
+        # Keyboard shortcuts, window-wide so they work whichever panel has
+        # focus. Arrow-key repeats are coalesced by _request_nav.
+        self._key_actions = {
+            Qt.Key.Key_Left: self._request_nav_previous,
+            Qt.Key.Key_Right: self._request_nav_next,
+            Qt.Key.Key_Home: self.go_to_first,
+            Qt.Key.Key_End: self.go_to_today,
+            Qt.Key.Key_F1: self._show_about,
+        }
+        for key, action in self._key_actions.items():
+            QShortcut(QKeySequence(key), self).activated.connect(action)
     
+    @pyqtSlot(str, object)
     def on_comic_loading_started(self, comic_name: str, comic_date):
         """
         Handle comic loading started event.
@@ -445,15 +1066,16 @@ class MainWindow(QMainWindow):
             comic_name: Name of the comic being loaded
             comic_date: Date of the comic being loaded
         """
-        date_str = comic_date.strftime("%B %d, %Y")
+        date_str = _fmt_long_date(comic_date)
         self.update_status(f"Loading {comic_name} for {date_str}...")
         
         # Clear any previous error messages
-        self._last_error_message = ""
+        self._last_error_hash = None
         
         # Show loading state in comic viewer (this clears errors)
         self.comic_viewer.show_loading_state()
     
+    @pyqtSlot(str, object)
     def on_comic_loading_finished(self, comic_name: str, comic_date):
         """
         Handle comic loading finished event.
@@ -462,17 +1084,17 @@ class MainWindow(QMainWindow):
             comic_name: Name of the comic that finished loading
             comic_date: Date of the comic that finished loading
         """
-        if hasattr(self, '_auto_advancing'):
-            self._auto_advancing = False
+        self._auto_advancing = False
 
         # Sync calendar to the actual date that was loaded.
         # The service may have silently fallen back to an earlier date
         # (e.g. today's comic not yet available → yesterday's returned).
-        if self.calendar_widget.get_selected_date() != comic_date:
-            self.calendar_widget.navigate_to_date(comic_date, emit_signal=False)
+        if self._current_date != comic_date:
+            self._navigate_to_date(comic_date, emit_signal=False)
 
-        self.update_status("Ready", 2000)
+        self.update_status(_MSG_READY, 2000)
     
+    @pyqtSlot(str, str, str)
     def on_loading_error(self, error_message: str, recovery_suggestions: str, error_type: str = "general"):
         """
         Handle loading error event with enhanced error recovery.
@@ -483,22 +1105,20 @@ class MainWindow(QMainWindow):
             error_type: Type of error for appropriate UI styling
         """
         # Debounce multiple error signals for the same error
-        import time
-        current_time = time.time()
+        current_time = time.monotonic()
+        message_hash = hash(error_message)
         
         # Ignore duplicate errors within 2 seconds
-        if (current_time - self._last_error_time < 2.0 and 
-            error_message == self._last_error_message):
+        if (message_hash == self._last_error_hash and
+                current_time - self._last_error_time < 2.0):
             return
         
         self._last_error_time = current_time
-        self._last_error_message = error_message
+        self._last_error_hash = message_hash
         
         # If we're in auto-advance mode, keep trying the next day
-        if hasattr(self, '_auto_advancing') and self._auto_advancing:
-            from datetime import date, timedelta
-            
-            current_date = self.calendar_widget.get_selected_date()
+        if self._auto_advancing:
+            current_date = self._current_date
             start_date = self._auto_advance_start
             
             # Check if we've searched too far (31 days)
@@ -520,10 +1140,10 @@ class MainWindow(QMainWindow):
             # Show progress
             comic_def = get_comic_definition(self._auto_advance_comic)
             comic_display_name = comic_def.display_name if comic_def else self._auto_advance_comic
-            self.update_status(f"Searching for next {comic_display_name}... {next_date.strftime('%b %d')}")
+            self.update_status(f"Searching for next {comic_display_name}... {_fmt_short_date(next_date)}")
             
             # Keep trying
-            self.calendar_widget.navigate_to_date(next_date)
+            self._navigate_to_date(next_date)
             self.comic_controller.load_comic(self._auto_advance_comic, next_date)
             return
         
@@ -535,9 +1155,6 @@ class MainWindow(QMainWindow):
         
         # Show error in comic viewer with recovery options
         self.comic_viewer.show_error_state(error_message, error_type, recovery_options)
-        
-        # Set up error recovery callback
-        self.comic_viewer.set_error_recovery_callback(self._handle_error_recovery)
     
 
         
@@ -554,32 +1171,18 @@ class MainWindow(QMainWindow):
         Returns:
             List of recovery action labels
         """
-        recovery_options = ["Retry"]  # Always include retry
-        
-        if error_type == "network":
-            recovery_options.extend(["Try Yesterday", "Try Different Date"])
-        elif error_type == "unavailable":
-            recovery_options.extend(["Try Yesterday", "Try Different Date", "Select Different Comic"])
-        elif error_type == "parsing":
-            recovery_options.extend(["Try Different Date", "Select Different Comic"])
+        # Dict used as an ordered set: insertion order, constant-time membership
+        # Always include retry, then the actions for this type of error
+        recovery_options = dict.fromkeys(("Retry", *_RECOVERY_BY_TYPE.get(error_type, ())))
         
         # Parse specific suggestions from the error handler
         if suggestions:
-            suggestion_list = [s.strip().lower() for s in suggestions.split(';')]
-            
-            if any("previous day" in s or "yesterday" in s for s in suggestion_list):
-                if "Try Yesterday" not in recovery_options:
-                    recovery_options.append("Try Yesterday")
-            
-            if any("different date" in s for s in suggestion_list):
-                if "Try Different Date" not in recovery_options:
-                    recovery_options.append("Try Different Date")
-            
-            if any("different comic" in s or "another comic" in s for s in suggestion_list):
-                if "Select Different Comic" not in recovery_options:
-                    recovery_options.append("Select Different Comic")
+            text = suggestions.lower()
+            for keyword, label in _RECOVERY_KEYWORDS.items():
+                if keyword in text:
+                    recovery_options.setdefault(label)
         
-        return recovery_options
+        return list(recovery_options)
     
     def _handle_error_recovery(self, action: str, data):
         """
@@ -593,11 +1196,11 @@ class MainWindow(QMainWindow):
         
         if action == "try_date":
             # Load comic for specific date
-            current_comic = self.comic_selector.get_selected_comic()
+            current_comic = self._current_comic
             if current_comic and data:
-                self.calendar_widget.navigate_to_date(data)
+                self._navigate_to_date(data)
                 self.comic_controller.load_comic(current_comic, data)
-                self.update_status(f"Trying {data.strftime('%B %d, %Y')}...")
+                self.update_status(f"Trying {_fmt_long_date(data)}...")
         
         elif action == "select_date":
             # Open calendar for date selection
@@ -613,9 +1216,24 @@ class MainWindow(QMainWindow):
     
     def _show_date_selection_dialog(self):
         """Show a date selection dialog for error recovery."""
-        from PyQt6.QtWidgets import QCalendarWidget, QDialog, QVBoxLayout, QPushButton, QHBoxLayout
-        from datetime import date
+        # Built on first use and reused for later recoveries
+        if self._date_dialog is None:
+            self._date_dialog = self._build_date_dialog()
         
+        # Refresh for this opening: today may have changed since the last one
+        today = date.today()
+        self._date_calendar.setMaximumDate(today)
+        self._date_calendar.setSelectedDate(today)
+        
+        self._date_dialog.exec()
+    
+    def _build_date_dialog(self) -> QDialog:
+        """
+        Build the date selection dialog used for error recovery.
+        
+        Returns:
+            The dialog; its calendar is kept in self._date_calendar
+        """
         dialog = QDialog(self)
         dialog.setWindowTitle("Select Date")
         dialog.setModal(True)
@@ -624,16 +1242,14 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(dialog)
         
         # Calendar widget
-        calendar = QCalendarWidget()
-        calendar.setMaximumDate(date.today())
-        
-        layout.addWidget(calendar)
+        self._date_calendar = QCalendarWidget()
+        layout.addWidget(self._date_calendar)
         
         # Buttons
         button_layout = QHBoxLayout()
         
         ok_button = QPushButton("Load Comic")
-        ok_button.clicked.connect(lambda: self._load_selected_date(calendar.selectedDate().toPython(), dialog))
+        ok_button.clicked.connect(self._on_date_dialog_accepted)
         
         cancel_button = QPushButton("Cancel")
         cancel_button.clicked.connect(dialog.reject)
@@ -642,67 +1258,68 @@ class MainWindow(QMainWindow):
         button_layout.addWidget(cancel_button)
         layout.addLayout(button_layout)
         
-        dialog.exec()
+        return dialog
+    
+    @pyqtSlot()
+    def _on_date_dialog_accepted(self):
+        """Load the comic for the date picked in the date selection dialog."""
+        self._load_selected_date(self._date_calendar.selectedDate().toPyDate(), self._date_dialog)
     
     def _load_selected_date(self, selected_date, dialog):
         """Load comic for the selected date from the dialog."""
-        current_comic = self.comic_selector.get_selected_comic()
+        current_comic = self._current_comic
         if current_comic:
-            self.calendar_widget.navigate_to_date(selected_date)
+            self._navigate_to_date(selected_date)
             self.comic_controller.load_comic(current_comic, selected_date)
-            self.update_status(f"Loading {current_comic} for {selected_date.strftime('%B %d, %Y')}...")
+            self.update_status(f"Loading {current_comic} for {_fmt_long_date(selected_date)}...")
         
         dialog.accept()
     
     def _highlight_comic_selector(self):
         """Temporarily highlight the comic selector to draw attention."""
-        from PyQt6.QtCore import QTimer
-        
-        # Add temporary highlighting style
-        original_style = self.comic_selector.styleSheet()
-        highlight_style = original_style + """
-            QWidget {
-                border: 2px solid #007bff;
-                border-radius: 4px;
-            }
-        """
-        
-        self.comic_selector.setStyleSheet(highlight_style)
+        # Repeated errors just extend the running highlight
+        if not self._highlight_timer.isActive():
+            self._selector_qss = self.comic_selector.styleSheet()
+            self.comic_selector.setStyleSheet(self._selector_qss + _HIGHLIGHT_QSS)
         
         # Remove highlighting after 3 seconds
-        def remove_highlight():
-            self.comic_selector.setStyleSheet(original_style)
-        
-        QTimer.singleShot(3000, remove_highlight)
+        self._highlight_timer.start(3000)
+
+    @pyqtSlot()
+    def _unhighlight_comic_selector(self):
+        """Restore the comic selector's style once the highlight expires."""
+        self.comic_selector.setStyleSheet(self._selector_qss)
     
+    @pyqtSlot()
     def go_to_first(self):
         """Navigate to the first available comic (start date)."""
-        current_comic = self.comic_selector.get_selected_comic()
+        self._cancel_search()
+        current_comic = self._current_comic
         if current_comic:
-            comic_def = get_comic_definition(current_comic)
+            comic_def = self._current_comic_def
             if comic_def and comic_def.earliest_date:
                 # Update calendar to the start date (don't emit signal to prevent double-load)
-                self.calendar_widget.navigate_to_date(comic_def.earliest_date, emit_signal=False)
+                self._navigate_to_date(comic_def.earliest_date, emit_signal=False)
                 
                 # Load the first comic
                 self.comic_controller.load_comic(current_comic, comic_def.earliest_date)
             else:
                 self.update_status("No start date available for this comic", 3000)
         else:
-            self.update_status("Please select a comic first", 3000)
+            self.update_status(_MSG_NO_COMIC, 3000)
     
+    @pyqtSlot()
     def go_to_today(self):
         """Navigate to today's comic, or yesterday if today not available."""
-        from datetime import date, timedelta
-        
+        self._cancel_search()
         today = date.today()
         
-        current_comic = self.comic_selector.get_selected_comic()
+        current_comic = self._current_comic
         if not current_comic:
-            self.update_status("Please select a comic first", 3000)
+            self.update_status(_MSG_NO_COMIC, 3000)
             return
         
-        comic_def = get_comic_definition(current_comic)
+        comic_def = self._current_comic_def
         target_date = today
         
         # Ensure the target date is available, otherwise go back to find the first available one
@@ -722,198 +1339,245 @@ class MainWindow(QMainWindow):
                     target_date = comic_def.earliest_date
 
         # Update calendar to target date (don't emit signal to prevent double-load)
-        self.calendar_widget.navigate_to_date(target_date, emit_signal=False)
+        self._navigate_to_date(target_date, emit_signal=False)
         
         # Load the comic
         self.comic_controller.load_comic(current_comic, target_date)
     
+    @pyqtSlot()
     def go_to_previous_day(self):
-        """Navigate to the previous day's comic - synchronous search."""
-        from datetime import date, timedelta
-        from PyQt6.QtWidgets import QApplication
+        """Navigate to the previous day's comic, searching in the background."""
+        self._start_search(-1)
+    
+    @pyqtSlot()
+    def go_to_next_day(self):
+        """Navigate to the next day's comic, searching in the background."""
+        self._start_search(1)
+    
+    def _start_search(self, step: int, days: int = 1):
+        """
+        Start a search for the nearest comic before or after the current date.
         
-        current_date = self.calendar_widget.get_selected_date()
-        if not current_date:
-            self.update_status("Please select a date first", 3000)
-            return
+        Any search still running is cancelled.
         
-        current_comic = self.comic_selector.get_selected_comic()
+        Args:
+            step: -1 to search backwards, 1 to search forwards
+            days: Days to move before the first date tried; the search
+                never starts past the comic's start date or today
+        """
+        current_comic = self._current_comic
         if not current_comic:
-            self.update_status("Please select a comic first", 3000)
+            self.update_status(_MSG_NO_COMIC, 3000)
             return
         
-        comic_def = get_comic_definition(current_comic)
-        comic_display_name = comic_def.display_name if comic_def else current_comic
-        earliest_date = comic_def.earliest_date if comic_def else date(1900, 1, 1)
+        current_date = self._current_date
+        start_date = current_date + timedelta(days=(days - 1) * step)
+        if step < 0:
+            comic_def = self._current_comic_def
+            earliest_date = comic_def.earliest_date if comic_def else None
+            earliest_date = earliest_date or date(1900, 1, 1)
+            start_date = max(start_date, min(current_date, earliest_date + timedelta(days=1)))
+        else:
+            start_date = min(start_date, max(current_date, date.today() - timedelta(days=1)))
         
-        # Search for the previous available comic
-        search_date = current_date
-        days_attempted = 0
+        self._run_search(current_comic, start_date, step)
+    
+    def _run_search(self, comic_name: str, start_date: date, step: int,
+                    scope: Optional[str] = None):
+        """
+        Cancel any running search and start a new one in the search pool.
         
-        while days_attempted < 7:
-            search_date -= timedelta(days=1)
-            
-            # Don't go before comic start
-            if search_date < earliest_date:
-                self.update_status("Reached comic's start date", 3000)
-                return
+        Args:
+            comic_name: Name of the comic strip
+            start_date: Date to search from (not itself tried)
+            step: -1 to search backwards, 1 to search forwards
+            scope: Description of the searched range for the not-found message
+        """
+        self._cancel_search()
+        self._search_pool.start(ComicSearchWorker(
+            self.comic_controller.comic_service, comic_name, start_date, step,
+            self._search_id, self._search_signals, self._fetch_shared,
+            self._release_fetch, scope
+        ))
+    
+    def _fetch_shared(self, comic_name: str, comic_date: date) -> Future:
+        """
+        Queue a fetch of a comic in the I/O pool, or join the fetch of it
+        already queued or under way. Safe to call from any thread; every
+        call must be paired with _release_fetch.
+        
+        Args:
+            comic_name: Name of the comic strip
+            comic_date: Date of the comic to fetch
             
-            # Check for skip range jump
-            if comic_def and comic_def.skip_ranges:
-                jumped = False
-                for start_str, end_str in comic_def.skip_ranges:
-                    range_start = date.fromisoformat(start_str)
-                    range_end = date.fromisoformat(end_str)
-                    if range_start <= search_date <= range_end:
-                        # Jump to the day before the start of the gap
-                        search_date = range_start - timedelta(days=1)
-                        jumped = True
-                        if search_date < earliest_date:
-                            self.update_status("Reached comic's start date", 3000)
-                            return
-                        break
-                if jumped:
-                    # After a jump, re-check availability for the new date
-                    if not comic_def.is_available(search_date):
-                        # If still not available (e.g. another gap or frequency), keep searching
-                        continue
-
-            # Skip known unavailable dates
-            if comic_def and not comic_def.is_available(search_date):
-                continue
+        Returns:
+            Future resolving to the ComicData (or raising the fetch error)
             
-            # We found a date that SHOULD have a comic. Try to fetch it.
-            self.update_status(f"Trying {comic_display_name} for {search_date.strftime('%b %d')}...")
-            self.comic_viewer.show_loading_state()
-            QApplication.processEvents()
+        Raises:
+            RuntimeError: If the I/O pool has been shut down
+        """
+        key = (comic_name, comic_date)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self._inflight_waiters[future] = self._inflight_waiters.get(future, 0) + 1
+                return future
+            future = Future()
+            self._inflight[key] = future
+            self._inflight_waiters[future] = 1
+        # Outside the lock: callbacks of a finished fetch run at once
+        future.add_done_callback(lambda f: self._forget_inflight(key, f))
+        try:
+            runner = self._io_pool.submit(self._run_fetch, future, comic_name, comic_date)
+        except RuntimeError:
+            future.cancel()
+            raise
+        # A runner dropped by the pool's shutdown never starts the fetch
+        runner.add_done_callback(lambda r: r.cancelled() and future.cancel())
+        return future
+    
+    def _claim_fetch(self, future: Future) -> bool:
+        """Mark a queued shared fetch as started by the caller, who must then run it."""
+        with self._inflight_lock:
+            if future.running() or future.done():
+                return False
+            return future.set_running_or_notify_cancel()
+    
+    def _run_fetch(self, future: Future, comic_name: str, comic_date: date):
+        """Run a shared fetch on the calling thread, unless it has been claimed or cancelled."""
+        if not self._claim_fetch(future):
+            return
+        try:
+            future.set_result(
+                self.comic_controller.comic_service.get_comic(comic_name, comic_date)
+            )
+        except Exception as e:
+            future.set_exception(e)
+    
+    def _load_shared(self, comic_name: str, comic_date: date) -> ComicData:
+        """
+        Load a comic for the user on the calling thread (the controller's
+        load thread). A fetch of it already running is waited for; one
+        still queued in the I/O pool is taken over and run here, so user
+        loads never wait behind speculative fetches.
+        
+        Args:
+            comic_name: Name of the comic strip
+            comic_date: Date of the comic to load
             
-            try:
-                comic_service = self.comic_controller.comic_service
-                
-                # Check cache first
-                cached = comic_service.cache_manager.get_cached_comic(current_comic, search_date)
-                if cached:
-                    self.calendar_widget.navigate_to_date(search_date, emit_signal=False)
-                    self.comic_viewer.display_comic(cached)
-                    self.update_status("Ready", 2000)
-                    return
-                
-                # Try fetch
-                comic_data = comic_service.get_comic(current_comic, search_date)
-                self.calendar_widget.navigate_to_date(search_date, emit_signal=False)
-                self.comic_viewer.display_comic(comic_data)
-                self.update_status("Ready", 2000)
-                return
-                
-            except Exception as e:
-                # Undefined gap or error, increment attempts and keep searching
-                days_attempted += 1
-                continue
+        Returns:
+            The loaded ComicData
             
-        self.update_status(f"No {comic_display_name} found in previous 14 days", 3000)
-
-
+        Raises:
+            Exception: Whatever get_comic raised for the comic
+        """
+        future = self._fetch_shared(comic_name, comic_date)
+        try:
+            self._run_fetch(future, comic_name, comic_date)
+            return future.result()
+        finally:
+            self._release_fetch(future)
     
-    def go_to_next_day(self):
-        """Navigate to the next day's comic - synchronous search."""
-        from datetime import date, timedelta
-        from PyQt6.QtWidgets import QApplication
+    def _release_fetch(self, future: Future):
+        """
+        Give up on a Future from _fetch_shared. When its last waiter leaves,
+        a fetch still queued is cancelled; one already running finishes and
+        caches its comic.
         
-        current_date = self.calendar_widget.get_selected_date()
-        if not current_date:
-            self.update_status("Please select a date first", 3000)
-            return
+        Args:
+            future: Future returned by _fetch_shared
+        """
+        with self._inflight_lock:
+            waiters = self._inflight_waiters.get(future)
+            if waiters is None:
+                return  # Already finished and forgotten
+            if waiters > 1:
+                self._inflight_waiters[future] = waiters - 1
+            else:
+                del self._inflight_waiters[future]
+                future.cancel()  # No-op unless still queued
+    
+    def _forget_inflight(self, key: tuple, future: Future):
+        """Drop a finished fetch so the next request for it starts afresh."""
+        with self._inflight_lock:
+            self._inflight_waiters.pop(future, None)
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+    
+    def _request_nav(self, delta: int):
+        """
+        Queue a day step from the keyboard, coalescing key repeats.
         
-        current_comic = self.comic_selector.get_selected_comic()
-        if not current_comic:
-            self.update_status("Please select a comic first", 3000)
+        Args:
+            delta: -1 for a step back, 1 for a step forward
+        """
+        self._pending_nav_offset += delta
+        self._nav_timer.start()
+    
+    @pyqtSlot()
+    def _request_nav_previous(self):
+        """Queue a step back (Left arrow)."""
+        self._request_nav(-1)
+    
+    @pyqtSlot()
+    def _request_nav_next(self):
+        """Queue a step forward (Right arrow)."""
+        self._request_nav(1)
+    
+    @pyqtSlot()
+    def _dispatch_nav(self):
+        """Search once for the steps queued since the last key repeat."""
+        offset = self._pending_nav_offset
+        self._pending_nav_offset = 0
+        if offset:
+            self._start_search(1 if offset > 0 else -1, abs(offset))
+    
+    def _cancel_search(self):
+        """Make any running previous/next search stop at its next step."""
+        self._search_id += 1
+        self._search_signals.latest_search_id = self._search_id
+    
+    @pyqtSlot(int, object)
+    def _on_search_progress(self, search_id: int, search_date: date):
+        """Report the date a previous/next search is fetching."""
+        if search_id != self._search_id:
             return
-        
-        comic_def = get_comic_definition(current_comic)
-        comic_display_name = comic_def.display_name if comic_def else current_comic
-        today = date.today()
-        
-        # Search for the next available comic
-        search_date = current_date
-        days_attempted = 0
-        
-        while days_attempted < 7:
-            search_date += timedelta(days=1)
-            
-            # Don't go beyond today
-            if search_date > today:
-                self.update_status("Reached today's date", 3000)
-                return
-            
-            # Check for skip range jump
-            if comic_def and comic_def.skip_ranges:
-                jumped = False
-                for start_str, end_str in comic_def.skip_ranges:
-                    range_start = date.fromisoformat(start_str)
-                    range_end = date.fromisoformat(end_str)
-                    if range_start <= search_date <= range_end:
-                        # Jump to the day after the end of the gap
-                        search_date = range_end + timedelta(days=1)
-                        jumped = True
-                        if search_date > today:
-                            self.update_status("Reached today's date", 3000)
-                            return
-                        break
-                if jumped:
-                    # After a jump, re-check availability for the new date
-                    if not comic_def.is_available(search_date):
-                        # If still not available, keep searching
-                        continue
-
-            # Skip known unavailable dates
-            if comic_def and not comic_def.is_available(search_date):
-                continue
-            
-            # We found a date that SHOULD have a comic. Try to fetch it.
-            self.update_status(f"Trying {comic_display_name} for {search_date.strftime('%b %d')}...")
-            self.comic_viewer.show_loading_state()
-            QApplication.processEvents()
-            
-            try:
-                comic_service = self.comic_controller.comic_service
-                
-                # Check cache first
-                cached = comic_service.cache_manager.get_cached_comic(current_comic, search_date)
-                if cached:
-                    self.calendar_widget.navigate_to_date(search_date, emit_signal=False)
-                    self.comic_viewer.display_comic(cached)
-                    self.update_status("Ready", 2000)
-                    return
-                
-                # Try fetch
-                comic_data = comic_service.get_comic(current_comic, search_date)
-                self.calendar_widget.navigate_to_date(search_date, emit_signal=False)
-                self.comic_viewer.display_comic(comic_data)
-                self.update_status("Ready", 2000)
-                return
-                
-            except Exception as e:
-                # Undefined gap or error, increment attempts and keep searching
-                days_attempted += 1
-                continue
-            
-        self.update_status(f"No {comic_display_name} found in next 14 days", 3000)
-
-
+        comic_def = self._current_comic_def
+        comic_display_name = comic_def.display_name if comic_def else self._current_comic
+        self.update_status(f"Trying {comic_display_name} for {_fmt_short_date(search_date)}...")
+        self.comic_viewer.show_loading_state()
     
+    @pyqtSlot(int, object, object)
+    def _on_search_found(self, search_id: int, found_date: date, comic_data):
+        """Show the comic a previous/next search found."""
+        if search_id != self._search_id:
+            return
+        with self._batch_updates():
+            self._navigate_to_date(found_date, emit_signal=False)
+            self.comic_viewer.display_comic(comic_data)
+        self.update_status(_MSG_READY, 2000)
+    
+    @pyqtSlot(int, str)
+    def _on_search_not_found(self, search_id: int, message: str):
+        """Report a previous/next search that ended without a comic."""
+        if search_id != self._search_id:
+            return
+        self.update_status(message, 3000)
+        # Put back the comic the loading state replaced
+        comic_data = self.comic_viewer.get_current_comic_data()
+        if comic_data and comic_data.date == self._current_date:
+            self.comic_viewer.display_comic(comic_data)
+    
+    @pyqtSlot()
     def go_to_random(self):
         """Navigate to a random date's comic for the currently selected comic."""
-        import random
-        from datetime import date, timedelta
-        from PyQt6.QtWidgets import QApplication
-        
-        current_comic = self.comic_selector.get_selected_comic()
+        self._cancel_search()
+        current_comic = self._current_comic
         if not current_comic:
-            self.update_status("Please select a comic first", 3000)
+            self.update_status(_MSG_NO_COMIC, 3000)
             return
         
-        comic_def = get_comic_definition(current_comic)
-        comic_display_name = comic_def.display_name if comic_def else current_comic
+        comic_def = self._current_comic_def
         earliest_date = comic_def.earliest_date if comic_def else date(2000, 1, 1)
         today = date.today()
         
@@ -923,10 +1587,13 @@ class MainWindow(QMainWindow):
             self.update_status("No comics available yet for this title", 3000)
             return
         
+        # Keep the forward search clear of today where the archive allows
+        max_offset = max(0, days_available - RANDOM_SEARCH_DAYS)
+        
         # Pick ONE random date that is known to be available
         random_date = None
         for _ in range(100):  # Try 100 times to find an available date
-            random_offset = random.randint(0, days_available)
+            random_offset = random.randint(0, max_offset)
             candidate_date = earliest_date + timedelta(days=random_offset)
             if comic_def and comic_def.is_available(candidate_date):
                 random_date = candidate_date
@@ -934,84 +1601,20 @@ class MainWindow(QMainWindow):
         
         if not random_date:
             # Fallback to pure random if no available date found in 100 tries
-            random_offset = random.randint(0, days_available)
+            random_offset = random.randint(0, max_offset)
             random_date = earliest_date + timedelta(days=random_offset)
         
-        # Now iterate forward from that date until we find a comic (max 14 days)
-        search_date = random_date
-        days_attempted = 0
-        
-        while days_attempted < 7:
-            # Don't go beyond today
-            if search_date > today:
-                self.update_status("Reached today's date", 3000)
-                return
-            
-            # Check for skip range jump
-            if comic_def and comic_def.skip_ranges:
-                jumped = False
-                for start_str, end_str in comic_def.skip_ranges:
-                    range_start = date.fromisoformat(start_str)
-                    range_end = date.fromisoformat(end_str)
-                    if range_start <= search_date <= range_end:
-                        # Jump to the day after the end of the gap
-                        search_date = range_end + timedelta(days=1)
-                        jumped = True
-                        if search_date > today:
-                            self.update_status("Reached today's date", 3000)
-                            return
-                        break
-                if jumped:
-                    # After a jump, re-check availability
-                    if not comic_def.is_available(search_date):
-                        # If still not available, increment and keep searching
-                        search_date += timedelta(days=1)
-                        continue
-
-            # Skip known unavailable dates
-            if comic_def and not comic_def.is_available(search_date):
-                search_date += timedelta(days=1)
-                continue
-            
-            # We found a date that SHOULD have a comic. Try to fetch it.
-            self.update_status(f"Trying {comic_display_name} for {search_date.strftime('%b %d, %Y')}...")
-            self.comic_viewer.show_loading_state()
-            QApplication.processEvents()
-            
-            try:
-                comic_service = self.comic_controller.comic_service
-                
-                # Check cache first
-                cached = comic_service.cache_manager.get_cached_comic(current_comic, search_date)
-                if cached:
-                    self.calendar_widget.navigate_to_date(search_date, emit_signal=False)
-                    self.comic_viewer.display_comic(cached)
-                    self.update_status("Ready", 2000)
-                    return
-                
-                # Try fetch
-                comic_data = comic_service.get_comic(current_comic, search_date)
-                self.calendar_widget.navigate_to_date(search_date, emit_signal=False)
-                self.comic_viewer.display_comic(comic_data)
-                self.update_status("Ready", 2000)
-                return
-                
-            except Exception as e:
-                # Undefined gap or error, increment attempts and keep searching
-                days_attempted += 1
-                search_date += timedelta(days=1)
-                continue
-            
-        self.update_status(f"No {comic_display_name} found in 14 days from random date", 3000)
-
-
-
+        # Now search forward from that date (inclusive) until we find a comic
+        self._run_search(current_comic, random_date - timedelta(days=1), 1,
+                         scope=f"{RANDOM_SEARCH_DAYS} days from random date")
     
+    @pyqtSlot()
     def _show_about(self):
         """Show the About dialog."""
         dlg = AboutDialog(self)
         dlg.exec()
 
+    @pyqtSlot()
     def _open_cache_folder(self):
         """Open the cache folder in the system's file manager with environment cleaning for AppImages."""
         cache_path = os.path.abspath(os.path.join(os.getcwd(), "cache"))
@@ -1048,14 +1651,6 @@ class MainWindow(QMainWindow):
 
 
 
-    def keyPressEvent(self, event):
-        """Handle key press events — F1 opens About dialog."""
-        if event.key() == Qt.Key.Key_F1:
-            self._show_about()
-            event.accept()
-            return
-        super().keyPressEvent(event)
-
     def get_comic_controller(self) -> ComicController:
         """Get the comic controller instance."""
         return self.comic_controller
@@ -1064,10 +1659,33 @@ class MainWindow(QMainWindow):
         """Handle application close event."""
         self.update_status("Closing application...")
         
-        # Clean up controller resources
+        # Stop previous/next searches and prefetches, then give the running
+        # ones a bounded time to finish so none signals a window being torn
+        # down; a fetch already under way finishes on its own
+        self._cancel_search()
+        self._search_pool.clear()
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._cancel_prefetch()
+        self._search_pool.waitForDone(CLOSE_WAIT_MS)
+        self._prefetch_pool.waitForDone(CLOSE_WAIT_MS)
+        
+        # Clean up controller resources. Disconnect first so results still
+        # queued or in flight are not delivered to a window being torn down;
+        # cleanup() then drops queued loads and waits for the running one.
         if self.comic_controller:
+            for signal in (self.comic_controller.comic_loaded,
+                           self.comic_controller.comic_loading_started,
+                           self.comic_controller.comic_loading_finished,
+                           self.comic_controller.loading_error):
+                try:
+                    signal.disconnect()
+                except TypeError:
+                    pass  # Already disconnected by an earlier close
             self.comic_controller.cleanup()
         
+        # Stop the viewer's image loading thread
+        self.comic_viewer.cleanup()
+        
         event.accept()
 
 